@@ -31,6 +31,10 @@ except ImportError:
     sys.exit(1)
 
 
+# Status color bars for every 0-255 value (one █ per 16 steps, · for zero)
+_BARS = tuple("█" * (value // 16) if value > 0 else "·" for value in range(256))
+
+
 # ============================================================================
 # ENTTEC DMX USB Pro Input Handler (same as main controller)
 # ============================================================================
@@ -42,6 +46,10 @@ class EnttecDMXProInput:
     END_DELIMITER = 0xE7
     LABEL_RECEIVED_DMX = 0x05
     LABEL_SET_RECEIVE_MODE = 0x08
+    MAX_PAYLOAD = 600  # Largest payload the widget sends (DMX + status byte)
+    _HEADER_STRUCT = struct.Struct('<BH')  # Label, then little-endian length
+    # Label 8 request: length 1, mode 0 = always send (framing built once)
+    RECEIVE_MODE_MESSAGE = bytes([0x7E, 0x08, 0x01, 0x00, 0x00, 0xE7])
 
     def __init__(self, port_name: str, baudrate: int = 115200):
         """
@@ -60,24 +68,21 @@ class EnttecDMXProInput:
             timeout=0.001  # Ultra-low timeout for minimal latency
         )
 
-        self.dmx_data = [0] * 512
+        self.dmx_data = bytearray(512)
         self.packet_count = 0
         self.last_status = 0
-        self.last_packet_time = time.time()
+        self.last_packet_time = time.monotonic()
+
+        # Receive buffer: serial bytes are read in bulk and framed here
+        self._rx = bytearray()
+        self._rx_off = 0  # Parse position; consumed bytes are compacted lazily
 
         # Enable always-send mode
         self._enable_always_receive()
 
     def _enable_always_receive(self):
         """Send Label 8 to enable always-send mode."""
-        message = bytes([
-            self.START_DELIMITER,
-            self.LABEL_SET_RECEIVE_MODE,
-            0x01, 0x00,  # Length: 1 byte
-            0x00,        # Mode: 0 = always send
-            self.END_DELIMITER
-        ])
-        self.port.write(message)
+        self.port.write(self.RECEIVE_MODE_MESSAGE)
 
     def poll(self) -> int:
         """
@@ -89,61 +94,63 @@ class EnttecDMXProInput:
         """
         packets_received = 0
 
-        # Try to read multiple messages (drain the buffer)
-        for _ in range(10):  # Max 10 packets per poll
-            try:
-                message = self._read_message()
-                if message and message['label'] == self.LABEL_RECEIVED_DMX:
-                    if self._process_dmx_packet(message['data']):
-                        packets_received += 1
-                else:
-                    break  # No more data available
-            except serial.SerialException as e:
-                # Serial port error - return what we have so far
-                print(f"\n⚠️  Serial port error: {e}")
-                print("    Continuing with last known DMX values...")
+        # Single read of everything the driver has buffered
+        try:
+            waiting = self.port.in_waiting
+            if not waiting:
+                return 0
+            self._rx += self.port.read(waiting)
+        except serial.SerialException as e:
+            # Serial port error - keep the last known values
+            print(f"\n⚠️  Serial port error: {e}")
+            print("    Continuing with last known DMX values...")
+            return 0
+
+        # Parse every complete message in the buffer (drain)
+        while True:
+            message = self._read_message()
+            if message is None:
                 break
+            if message['label'] == self.LABEL_RECEIVED_DMX:
+                if self._process_dmx_packet(message['data']):
+                    packets_received += 1
+
+        # Compact consumed bytes (deferred so steady state rarely moves memory)
+        if self._rx_off >= len(self._rx):
+            self._rx.clear()
+            self._rx_off = 0
+        elif self._rx_off > 4096:
+            del self._rx[:self._rx_off]
+            self._rx_off = 0
 
         return packets_received
 
     def _read_message(self) -> Optional[Dict]:
-        """Read a single message from device (non-blocking)."""
-        # Look for start delimiter
-        start_found = False
-        for _ in range(5):  # Max 5 attempts (reduced for speed)
-            byte = self.port.read(1)
-            if not byte:
+        """Parse the next complete message from the receive buffer."""
+        rx = self._rx
+        while True:
+            # Look for start delimiter (memchr over everything buffered)
+            start = rx.find(self.START_DELIMITER, self._rx_off)
+            if start < 0:
+                self._rx_off = len(rx)  # Nothing but noise buffered
                 return None
-            if byte[0] == self.START_DELIMITER:
-                start_found = True
-                break
 
-        if not start_found:
-            return None
-
-        # Read label
-        label_byte = self.port.read(1)
-        if not label_byte:
-            return None
-        label = label_byte[0]
-
-        # Read length (2 bytes, little-endian)
-        length_bytes = self.port.read(2)
-        if len(length_bytes) != 2:
-            return None
-        length = struct.unpack('<H', length_bytes)[0]
-
-        # Read payload
-        payload = self.port.read(length)
-        if len(payload) != length:
-            return None
+            # Need start, label and 2-byte length before the payload
+            self._rx_off = start
+            if len(rx) - start < 4:
+                return None
+            label, length = self._HEADER_STRUCT.unpack_from(rx, start + 1)
 
-        # Read end delimiter
-        end_byte = self.port.read(1)
-        if not end_byte or end_byte[0] != self.END_DELIMITER:
-            pass  # Continue anyway
+            end = start + 4 + length  # Index of the end delimiter
+            if length <= self.MAX_PAYLOAD:
+                if end >= len(rx):
+                    return None  # Message not fully received yet
+                if rx[end] == self.END_DELIMITER:
+                    self._rx_off = end + 1
+                    return {'label': label, 'data': bytes(rx[start + 4:end])}
 
-        return {'label': label, 'data': payload}
+            # 0x7E inside channel data, not a real message - resync after it
+            self._rx_off = start + 1
 
     def _process_dmx_packet(self, payload: bytes) -> bool:
         """Process a Label 5 (Received DMX) packet."""
@@ -165,13 +172,12 @@ class EnttecDMXProInput:
             # Skip start code, get channel data
             channels = dmx_with_start[1:]
 
-            # Update internal DMX data array
-            for i, value in enumerate(channels):
-                if i < 512:
-                    self.dmx_data[i] = value
+            # Update internal DMX data array (single slice copy)
+            n = min(len(channels), 512)
+            self.dmx_data[:n] = channels[:n]
 
             self.packet_count += 1
-            self.last_packet_time = time.time()
+            self.last_packet_time = time.monotonic()
             return True
 
         return False
@@ -228,17 +234,17 @@ class ColorFinder:
         print(f"   Universe: {dmx_universe} (logical)")
         print(f"   Channels: 1 (Red), 2 (Green), 3 (Blue)")
 
+        # No settle delay needed: buffered framing skips any partial or
+        # stale bytes the widget sends before it applies the receive mode
         self.dmx_input = EnttecDMXProInput(dmx_serial_port)
-        time.sleep(0.2)  # Let device initialize
         print(f"   ✓ ENTTEC DMX USB Pro ready")
 
         # RGB values
         self.red = 0
         self.green = 0
         self.blue = 0
-        self.target_red = 0
-        self.target_green = 0
-        self.target_blue = 0
+        self.current_rgb = [0.0, 0.0, 0.0]  # Smoothed RGB
+        self.target_rgb = [0, 0, 0]  # Hysteresis-filtered DMX RGB
 
         # Calculate output universes
         self.leds_per_universe = 512 // 3  # 170 LEDs per universe
@@ -265,7 +271,14 @@ class ColorFinder:
         self.universe_data = {}
         for i in range(self.num_universes):
             univ = output_universe_start + i
-            self.universe_data[univ] = [0] * 512
+            self.universe_data[univ] = bytearray(512)
+
+        # RGB channels used in each universe (the last one may be partial)
+        self.universe_channels = [
+            min(self.leds_per_universe, total_pixels - i * self.leds_per_universe) * 3
+            for i in range(self.num_universes)
+        ]
+        self._last_rgb = None  # Color currently handed to sACN
 
         self.running = False
 
@@ -281,44 +294,37 @@ class ColorFinder:
         # Poll for new DMX data (drain buffer)
         packets_received = self.dmx_input.poll()
 
-        # Get RGB values from channels 1-3
-        dmx_red = self.dmx_input.get_channel(1)
-        dmx_green = self.dmx_input.get_channel(2)
-        dmx_blue = self.dmx_input.get_channel(3)
+        # Get RGB values from channels 1-3 and filter all three in one pass
+        target = self.target_rgb
+        current = self.current_rgb
+        for i, dmx_value in enumerate(self.dmx_input.dmx_data[0:3]):
+            # Hysteresis: ignore small changes (< 2%)
+            if abs(dmx_value - target[i]) > 5:
+                target[i] = dmx_value
 
-        # Hysteresis: ignore small changes (< 2%)
-        if abs(dmx_red - self.target_red) > 5:
-            self.target_red = dmx_red
-        if abs(dmx_green - self.target_green) > 5:
-            self.target_green = dmx_green
-        if abs(dmx_blue - self.target_blue) > 5:
-            self.target_blue = dmx_blue
+            # Smooth interpolation (reduces jitter)
+            current[i] += (target[i] - current[i]) * 0.3
 
-        # Smooth interpolation (reduces jitter)
-        self.red += (self.target_red - self.red) * 0.3
-        self.green += (self.target_green - self.green) * 0.3
-        self.blue += (self.target_blue - self.blue) * 0.3
+        self.red, self.green, self.blue = current
 
         return packets_received
 
     def _render_frame(self):
         """Render one frame - set all LEDs to current RGB color."""
-        # Clear all universe buffers
-        for univ in self.universe_data:
-            self.universe_data[univ] = [0] * 512
-
-        # Set all pixels to the same color
-        for pixel_idx in range(self.total_pixels):
-            # Calculate universe and channel
-            universe_idx = pixel_idx // self.leds_per_universe
-            local_pixel_idx = pixel_idx % self.leds_per_universe
-            univ = self.output_universe_start + universe_idx
-            channel_offset = local_pixel_idx * 3
-
-            # Set pixel color
-            self.universe_data[univ][channel_offset] = int(self.red)
-            self.universe_data[univ][channel_offset + 1] = int(self.green)
-            self.universe_data[univ][channel_offset + 2] = int(self.blue)
+        # No clear needed: every pixel is overwritten below and the unused
+        # tail of the last universe stays zero from allocation
+        # Set all pixels to the same color: build one universe's worth of the
+        # 3-byte pattern per frame, then slice-assign it into each universe
+        # (a full-length bytes slice is the same object, so no copy)
+        rgb = bytes((int(self.red), int(self.green), int(self.blue)))
+        if rgb == self._last_rgb:
+            # Unchanged color: skip sacn's per-slot copy and validation of
+            # every universe (its sender thread still refreshes each second)
+            return
+        self._last_rgb = rgb
+        pattern = rgb * self.leds_per_universe
+        for data, num_channels in zip(self.universe_data.values(), self.universe_channels):
+            data[:num_channels] = pattern[:num_channels]
 
         # Send all universe data
         for univ, data in self.universe_data.items():
@@ -338,14 +344,16 @@ class ColorFinder:
 
         self.running = True
         frame_count = 0
-        start_time = time.time()
+        start_time = time.monotonic()
         last_report = start_time
         last_dmx_count = 0
-        target_frame_time = 1.0 / 60.0  # 60 FPS
+        frame_ns = 1_000_000_000 // 60  # 60 FPS
+        spin_ns = 1_500_000  # Final stretch before each deadline is spun, not slept
+        next_deadline_ns = time.monotonic_ns()
 
         try:
             while self.running:
-                frame_start = time.time()
+                frame_start = time.monotonic()
 
                 # 1. Update from DMX input (non-blocking, drain buffer)
                 packets_this_frame = self._update_from_dmx()
@@ -360,7 +368,7 @@ class ColorFinder:
                     r = int(self.red)
                     g = int(self.green)
                     b = int(self.blue)
-                    print(f"RGB: R:{r:3d} G:{g:3d} B:{b:3d} | Color: ({r:3d}, {g:3d}, {b:3d})")
+                    sys.stdout.write(f"RGB: R:{r:3d} G:{g:3d} B:{b:3d} | Color: ({r:3d}, {g:3d}, {b:3d})\n")
 
                 # Status report every 5 seconds
                 if frame_start - last_report >= 5.0:
@@ -373,7 +381,7 @@ class ColorFinder:
                     last_dmx_count = dmx_packets
 
                     # Calculate latency (time since last DMX packet)
-                    dmx_latency = (time.time() - self.dmx_input.last_packet_time) * 1000  # ms
+                    dmx_latency = (time.monotonic() - self.dmx_input.last_packet_time) * 1000  # ms
 
                     # Show current RGB values
                     r = int(self.red)
@@ -382,21 +390,30 @@ class ColorFinder:
                     rgb_str = f"RGB: ({r:3d}, {g:3d}, {b:3d})"
 
                     # Create color bar visualization (simple ASCII)
-                    r_bar = "█" * (r // 16) if r > 0 else "·"
-                    g_bar = "█" * (g // 16) if g > 0 else "·"
-                    b_bar = "█" * (b // 16) if b > 0 else "·"
-
-                    print(f"🎨 {fps:5.1f} FPS | DMX:{dmx_rate:5.1f} pkt/s | Latency:{dmx_latency:4.1f}ms | {rgb_str}")
-                    print(f"   R:{r_bar}")
-                    print(f"   G:{g_bar}")
-                    print(f"   B:{b_bar}")
+                    r_bar = _BARS[r]
+                    g_bar = _BARS[g]
+                    b_bar = _BARS[b]
+
+                    # One write for the whole report instead of four print() calls
+                    sys.stdout.write(
+                        f"🎨 {fps:5.1f} FPS | DMX:{dmx_rate:5.1f} pkt/s | Latency:{dmx_latency:4.1f}ms | {rgb_str}\n"
+                        f"   R:{r_bar}\n"
+                        f"   G:{g_bar}\n"
+                        f"   B:{b_bar}\n"
+                    )
                     last_report = frame_start
 
-                # Sleep to maintain target frame rate
-                frame_time = time.time() - frame_start
-                sleep_time = target_frame_time - frame_time
-                if sleep_time > 0:
-                    time.sleep(sleep_time)
+                # Pace to an absolute monotonic deadline: coarse sleep, then
+                # spin the last stretch so sleep jitter doesn't delay frames
+                next_deadline_ns += frame_ns
+                now_ns = time.monotonic_ns()
+                if now_ns > next_deadline_ns:
+                    next_deadline_ns = now_ns  # Running late - don't try to catch up
+                sleep_ns = next_deadline_ns - spin_ns - now_ns
+                if sleep_ns > 0:
+                    time.sleep(sleep_ns / 1e9)
+                while time.monotonic_ns() < next_deadline_ns:
+                    time.sleep(0)
 
         except KeyboardInterrupt:
             print("\n\n⚠️  Interrupted by user")
@@ -3,7 +3,8 @@
 DMX Fire Controller - Low Latency Integrated System
 
 Reads DMX input from ENTTEC DMX USB Pro and outputs fire effects via sACN.
-Optimized for minimal latency with single-threaded main loop.
+Optimized for minimal latency: a dedicated reader thread drains the ENTTEC
+while the main loop renders and sends frames.
 
 DMX Input Channels (from console):
 - Channel 1: Flicker Speed (color transition speed) (0-255)
@@ -26,6 +27,10 @@ from typing import Dict, List, Optional
 import math
 import sys
 import os
+import select
+import socket
+import threading
+import uuid
 
 # Import configuration
 try:
@@ -36,6 +41,10 @@ except ImportError:
     sys.exit(1)
 
 
+# Shared all-zero universe for blackout (immutable, so one object serves all)
+_BLACKOUT = bytes(512)
+
+
 # ============================================================================
 # ENTTEC DMX USB Pro Input Handler
 # ============================================================================
@@ -47,6 +56,10 @@ class EnttecDMXProInput:
     END_DELIMITER = 0xE7
     LABEL_RECEIVED_DMX = 0x05
     LABEL_SET_RECEIVE_MODE = 0x08
+    MAX_PAYLOAD = 600  # Largest payload the widget sends (DMX + status byte)
+    _HEADER_STRUCT = struct.Struct('<BH')  # Label, then little-endian length
+    # Label 8 request: length 1, mode 0 = always send (framing built once)
+    RECEIVE_MODE_MESSAGE = bytes([0x7E, 0x08, 0x01, 0x00, 0x00, 0xE7])
 
     def __init__(self, port_name: str, baudrate: int = 115200):
         """
@@ -65,24 +78,77 @@ class EnttecDMXProInput:
             timeout=0.001  # Ultra-low timeout for minimal latency
         )
 
-        self.dmx_data = [0] * 512
+        self.dmx_data = bytearray(512)
         self.packet_count = 0
         self.last_status = 0
-        self.last_packet_time = time.time()
+        self.last_packet_time = time.monotonic()
+
+        # Receive buffer: serial bytes are read in bulk and framed here
+        self._rx = bytearray()
+        self._rx_off = 0  # Parse position; consumed bytes are compacted lazily
+
+        # Readiness check on the serial fd so an idle poll() never blocks
+        # (POSIX only - Windows falls back to checking in_waiting)
+        self._poller = None
+        if hasattr(select, 'poll'):
+            try:
+                self._poller = select.poll()
+                self._poller.register(self.port.fileno(), select.POLLIN)
+            except (AttributeError, OSError, ValueError):
+                self._poller = None
+
+        # FTDI chips hold short reads for up to 16 ms by default
+        self.low_latency = self._set_low_latency(port_name)
 
         # Enable always-send mode
         self._enable_always_receive()
 
+    def _set_low_latency(self, port_name: str) -> bool:
+        """
+        Drop the FTDI USB latency timer to 1 ms (default 16 ms).
+
+        Linux: sysfs latency_timer, falling back to pyserial's low-latency
+        mode. macOS: IOSSDATALAT ioctl. Other platforms are left unchanged.
+
+        Returns:
+            True if the latency was lowered
+        """
+        if sys.platform.startswith('linux'):
+            device = os.path.basename(os.path.realpath(port_name))
+            timer_path = f"/sys/bus/usb-serial/devices/{device}/latency_timer"
+            permission_denied = False
+            try:
+                with open(timer_path, 'w') as f:
+                    f.write('1')
+                return True
+            except PermissionError:
+                permission_denied = True  # Only worth a warning if the fallback fails too
+            except OSError:
+                pass  # Not a usb-serial device
+
+            try:
+                self.port.set_low_latency_mode(True)
+                return True
+            except (AttributeError, OSError, ValueError, serial.SerialException):
+                if permission_denied:
+                    print(f"   ⚠️  No permission to set {timer_path} to 1 ms")
+                    print(f"       (run as root or add a udev rule; DMX input may lag up to 16 ms)")
+                return False
+
+        if sys.platform == 'darwin':
+            try:
+                import fcntl
+                IOSSDATALAT = 0x80085400  # _IOW('T', 0, unsigned long)
+                fcntl.ioctl(self.port.fileno(), IOSSDATALAT, struct.pack('L', 1000))  # microseconds
+                return True
+            except (ImportError, AttributeError, OSError, ValueError):
+                return False
+
+        return False
+
     def _enable_always_receive(self):
         """Send Label 8 to enable always-send mode."""
-        message = bytes([
-            self.START_DELIMITER,
-            self.LABEL_SET_RECEIVE_MODE,
-            0x01, 0x00,  # Length: 1 byte
-            0x00,        # Mode: 0 = always send
-            self.END_DELIMITER
-        ])
-        self.port.write(message)
+        self.port.write(self.RECEIVE_MODE_MESSAGE)
 
     def poll(self) -> int:
         """
@@ -90,68 +156,77 @@ class EnttecDMXProInput:
         Reads multiple packets if available.
 
         Returns:
-            Number of packets received
+            Number of packets received, or -1 on a serial port error
         """
         packets_received = 0
 
-        # Try to read multiple messages (drain the buffer)
-        for _ in range(10):  # Max 10 packets per poll
-            try:
-                message = self._read_message()
-                if message and message['label'] == self.LABEL_RECEIVED_DMX:
-                    if self._process_dmx_packet(message['data']):
-                        packets_received += 1
-                else:
-                    break  # No more data available
-            except serial.SerialException as e:
-                # Serial port error - return what we have so far
-                print(f"\n⚠️  Serial port error: {e}")
-                print("    Continuing with last known DMX values...")
+        # Single read of everything the driver has buffered; return at once
+        # when nothing is waiting instead of blocking on the read timeout
+        try:
+            if self._poller is not None and not self._poller.poll(0):
+                return 0
+            waiting = self.port.in_waiting
+            if not waiting:
+                return 0
+            self._rx += self.port.read(waiting)
+        except serial.SerialException as e:
+            # Serial port error - keep the last known values
+            print(f"\n⚠️  Serial port error: {e}")
+            print("    Continuing with last known DMX values...")
+            return -1
+
+        # Parse every complete message in the buffer (drain); they all
+        # arrived in this one read, so they share one timestamp
+        now = time.monotonic()
+        while True:
+            message = self._read_message()
+            if message is None:
                 break
+            if message['label'] == self.LABEL_RECEIVED_DMX:
+                if self._process_dmx_packet(message['data'], now):
+                    packets_received += 1
+
+        # Compact consumed bytes (deferred so steady state rarely moves memory)
+        if self._rx_off >= len(self._rx):
+            self._rx.clear()
+            self._rx_off = 0
+        elif self._rx_off > 4096:
+            del self._rx[:self._rx_off]
+            self._rx_off = 0
 
         return packets_received
 
     def _read_message(self) -> Optional[Dict]:
-        """Read a single message from device (non-blocking)."""
-        # Look for start delimiter
-        start_found = False
-        for _ in range(5):  # Max 5 attempts (reduced for speed)
-            byte = self.port.read(1)
-            if not byte:
+        """Parse the next complete message from the receive buffer."""
+        rx = self._rx
+        while True:
+            # Look for start delimiter
+            start = rx.find(self.START_DELIMITER, self._rx_off)
+            if start < 0:
+                self._rx_off = len(rx)  # Nothing but noise buffered
                 return None
-            if byte[0] == self.START_DELIMITER:
-                start_found = True
-                break
 
-        if not start_found:
-            return None
-
-        # Read label
-        label_byte = self.port.read(1)
-        if not label_byte:
-            return None
-        label = label_byte[0]
-
-        # Read length (2 bytes, little-endian)
-        length_bytes = self.port.read(2)
-        if len(length_bytes) != 2:
-            return None
-        length = struct.unpack('<H', length_bytes)[0]
-
-        # Read payload
-        payload = self.port.read(length)
-        if len(payload) != length:
-            return None
-
-        # Read end delimiter
-        end_byte = self.port.read(1)
-        if not end_byte or end_byte[0] != self.END_DELIMITER:
-            pass  # Continue anyway
-
-        return {'label': label, 'data': payload}
-
-    def _process_dmx_packet(self, payload: bytes) -> bool:
-        """Process a Label 5 (Received DMX) packet."""
+            # Need start, label and 2-byte length before the payload
+            self._rx_off = start
+            if len(rx) - start < 4:
+                return None
+            label, length = self._HEADER_STRUCT.unpack_from(rx, start + 1)
+
+            end = start + 4 + length  # Index of the end delimiter
+            if length <= self.MAX_PAYLOAD:
+                if end >= len(rx):
+                    return None  # Message not fully received yet
+                if rx[end] == self.END_DELIMITER:
+                    self._rx_off = end + 1
+                    # Slicing copies the payload once, so the buffer can
+                    # still be compacted while the message is in use
+                    return {'label': label, 'data': rx[start + 4:end]}
+
+            # 0x7E inside channel data, not a real message - resync after it
+            self._rx_off = start + 1
+
+    def _process_dmx_packet(self, payload: bytearray, received_time: float) -> bool:
+        """Process a Label 5 (Received DMX) packet read at received_time."""
         if len(payload) < 1:
             return False
 
@@ -163,20 +238,15 @@ class EnttecDMXProInput:
             # Non-zero status indicates errors, but we'll process anyway
             pass
 
-        # Extract DMX data (skip status byte)
-        dmx_with_start = payload[1:]
-
-        if len(dmx_with_start) > 0:
-            # Skip start code, get channel data
-            channels = dmx_with_start[1:]
-
-            # Update internal DMX data array
-            for i, value in enumerate(channels):
-                if i < 512:
-                    self.dmx_data[i] = value
+        # DMX data follows the status byte: start code, then channels
+        if len(payload) > 1:
+            # Update internal DMX data array straight from a view of the
+            # payload (single memcpy, no intermediate slices)
+            n = min(len(payload) - 2, 512)
+            self.dmx_data[:n] = memoryview(payload)[2:2 + n]
 
             self.packet_count += 1
-            self.last_packet_time = time.time()
+            self.last_packet_time = received_time
             return True
 
         return False
@@ -187,6 +257,15 @@ class EnttecDMXProInput:
             return self.dmx_data[channel - 1]
         return 0
 
+    def snapshot(self) -> bytes:
+        """
+        Copy of all 512 channels from a single DMX packet.
+
+        The copy is one C-level operation under the GIL, so it never mixes
+        channels from two packets even while a reader thread is polling.
+        """
+        return bytes(self.dmx_data)
+
     def close(self):
         """Close the serial port."""
         self.port.close()
@@ -196,12 +275,79 @@ class EnttecDMXProInput:
 # Fire Effect Components (from show_control.py)
 # ============================================================================
 
+# Waxing/waning intensity, 0.6 + 0.4 * (sin(phase) + 1) / 2, tabulated over
+# one period. Pixel phases are fixed-point integers: the top bits index the
+# table and the low 16 bits carry the fraction, so each frame costs an
+# integer add and a table lookup instead of math.sin()
+_WAVE_TABLE_BITS = 12  # 4096 entries
+_WAVE_FRACTION_BITS = 16
+_WAVE_PHASE_SCALE = (1 << (_WAVE_TABLE_BITS + _WAVE_FRACTION_BITS)) / (2.0 * math.pi)  # per radian
+_WAVE_SHIFT = _WAVE_FRACTION_BITS  # phase >> _WAVE_SHIFT = table position
+_WAVE_MASK = (1 << _WAVE_TABLE_BITS) - 1  # Wraps the position into the table
+_INTENSITY_WAVE = tuple(
+    0.6 + 0.4 * (math.sin(2.0 * math.pi * i / (1 << _WAVE_TABLE_BITS)) + 1.0) / 2.0
+    for i in range(1 << _WAVE_TABLE_BITS)
+)
+
+# Bank x master brightness below which every pixel is black: channels are at
+# most 255 and truncated by int(), so 255 * scale < 1 always gives 0. Same
+# threshold as the controller's output-dark test.
+_DARK_SCALE = 1.0 / 255.0
+
+# Normal transition durations as (low, high - low) in seconds, indexed by
+# int(10 * u) for a uniform draw u: quick flicker, medium transition, slow slide
+_QUICK_FLICKER = (0.05, 0.15)
+_MEDIUM_TRANSITION = (0.3, 0.5)
+_SLOW_SLIDE = (1.0, 1.5)
+_TRANSITION_RANGES = (_QUICK_FLICKER,) * 3 + (_MEDIUM_TRANSITION,) * 4 + (_SLOW_SLIDE,) * 3
+
+
+def _fire_color_samples(count: int, seed: int = 0) -> tuple:
+    """
+    Pre-draw the random parts of normal fire colors around R:255, G:127, B:15.
+
+    Returns:
+        Tuple of (red, base_green, intensity, blue) samples. Only the
+        color_shift adjustment of green is left to apply per color.
+    """
+    rng = random.Random(seed)
+    samples = []
+    for _ in range(count):
+        intensity = 0.6 + 0.4 * rng.random()
+        # Red: always high, around 255 with slight variation (245-255)
+        red = 245 + int(rng.random() * 11)
+        # Green: base 127 with normal variation (±25)
+        base_green = 127 + rng.gauss(0, 25)
+        # Blue: base is 15, with slight variation (-5 to +10)
+        blue = 15 + int(rng.random() * 16) - 5
+        samples.append((red, base_green, intensity, blue))
+    return tuple(samples)
+
+
+# Pool of pre-drawn fire colors shared by every pixel; picking one costs a
+# single random() instead of a gauss() and four more draws per new color
+_FIRE_COLOR_SAMPLES = _fire_color_samples(4096)
+
+
 class SmoothFirePixel:
     """Individual fire pixel with smooth transitions and waxing/waning intensity."""
 
-    def __init__(self, pixel_index: int, seed: int):
+    # Fixed attribute set: faster attribute access and much smaller objects
+    # for the ~1,700 pixels updated every frame
+    __slots__ = (
+        'pixel_index', 'rng',
+        'flicker_intensity', 'color_shift', 'sporadic_flicker',
+        'current_color', 'target_color', 'transition_start_time', 'transition_duration',
+        'base_intensity', 'intensity_phase', 'intensity_step',
+        'wind_gust_active', 'wind_gust_intensity', 'wind_gust_start_time', 'wind_gust_duration',
+    )
+
+    def __init__(self, pixel_index: int, seed: int = 0, rng: Optional[random.Random] = None,
+                 init_time: Optional[float] = None):
         self.pixel_index = pixel_index
-        self.rng = random.Random(seed)
+        # Pixels in a bank normally share the bank's generator; a private
+        # one (seeded per pixel) is only created when none is given
+        self.rng = rng if rng is not None else random.Random(seed)
 
         # Control parameters (must be set before generating colors)
         self.flicker_intensity = 0.5  # 0.0 to 1.0
@@ -211,13 +357,14 @@ class SmoothFirePixel:
         # Color transition state
         self.current_color = (0, 0, 0)
         self.target_color = self._generate_fire_color()
-        self.transition_start_time = time.time()
+        self.transition_start_time = time.monotonic() if init_time is None else init_time
         self.transition_duration = self.rng.uniform(0.2, 1.5)
 
         # Brightness waxing/waning
         self.base_intensity = self.rng.uniform(0.4, 0.9)
-        self.intensity_phase = self.rng.uniform(0, 6.28)
-        self.intensity_speed = self.rng.uniform(0.5, 3.0)
+        # Phase and per-frame step (0.01 x speed radians) in wave fixed point
+        self.intensity_phase = int(self.rng.uniform(0, 6.28) * _WAVE_PHASE_SCALE)
+        self.intensity_step = int(self.rng.uniform(0.5, 3.0) * 0.01 * _WAVE_PHASE_SCALE)
 
         # Wind gust / sporadic flicker state
         self.wind_gust_active = False
@@ -227,27 +374,23 @@ class SmoothFirePixel:
 
     def _generate_fire_color(self) -> tuple:
         """Generate a fire color based on custom base color (R:255, G:127, B:15)."""
+        random_ = self.rng.random
+
         # Check for rare special color flash (1% chance)
-        if self.rng.random() < 0.01:
-            if self.rng.random() < 0.67:
+        if random_() < 0.01:
+            if random_() < 0.67:
                 return (255, 255, 200)  # White-hot
             else:
                 return (100, 150, 255)  # Blue flame
 
-        # Normal fire color generation based on R:255, G:127, B:15
-        intensity = self.rng.uniform(0.6, 1.0)
-
-        # Red: always high, around 255 with slight variation
-        red = self.rng.randint(245, 255)
+        # Normal fire color generation based on R:255, G:127, B:15, drawn
+        # from the shared sample pool
+        red, base_green, intensity, blue = _FIRE_COLOR_SAMPLES[int(random_() * 4096)]
 
         # Green: base is 127, varies based on color_shift
         # color_shift 0.0 = yellower (green goes up toward ~170-200)
         # color_shift 1.0 = redder (green goes down toward ~50-80)
 
-        # Base green variation around 127
-        green_variation = self.rng.gauss(0, 25)  # Normal distribution ±25
-        base_green = 127 + green_variation
-
         # Apply color_shift to push green up (yellow) or down (red)
         # 0.0 = add up to +60 (yellower, max ~187)
         # 1.0 = subtract up to -60 (redder, min ~67)
@@ -258,128 +401,127 @@ class SmoothFirePixel:
         green = max(50, min(200, green))  # Clamp to reasonable range
         green = int(green * intensity)  # Apply intensity variation
 
-        # Blue: base is 15, with slight variation
-        blue_base = 15 + self.rng.randint(-5, 10)
-        blue = max(0, min(30, blue_base))
-
         return (red, green, blue)
 
-    def lerp_color(self, c1: tuple, c2: tuple, t: float) -> tuple:
-        """Linear interpolation between two colors."""
-        t = max(0.0, min(1.0, t))
-        r = int(c1[0] + (c2[0] - c1[0]) * t)
-        g = int(c1[1] + (c2[1] - c1[1]) * t)
-        b = int(c1[2] + (c2[2] - c1[2]) * t)
-        return (r, g, b)
+    def update(self, current_time: float, scale: float = 1.0) -> tuple:
+        """
+        Update the pixel color with smooth transitions.
+
+        Args:
+            current_time: Frame timestamp (time.monotonic())
+            scale: Extra brightness factor (bank x master intensity), folded
+                into the pixel's own intensity so the color is truncated to
+                an int only once
+        """
+        # Hot state is read into locals once and written back only when it
+        # changes (local access is much cheaper than attribute access)
+        rng = self.rng
 
-    def update(self, current_time: float) -> tuple:
-        """Update the pixel color with smooth transitions."""
         # Check if we need a new target color
         elapsed = current_time - self.transition_start_time
-        if elapsed >= self.transition_duration:
+        duration = self.transition_duration
+        if elapsed >= duration:
             # Transition complete, pick new target
             self.current_color = self.target_color
-            self.target_color = self._generate_fire_color()
+            target = self.target_color = self._generate_fire_color()
             self.transition_start_time = current_time
 
             # Check if this is a special flash color (white-hot or blue flame)
-            is_white_flash = (self.target_color[0] == 255 and self.target_color[1] == 255 and self.target_color[2] == 200)
-            is_blue_flash = (self.target_color[0] == 100 and self.target_color[1] == 150 and self.target_color[2] == 255)
-
-            if is_white_flash or is_blue_flash:
+            if target == (255, 255, 200) or target == (100, 150, 255):
                 # Special flash: very short duration (100-250ms)
-                self.transition_duration = self.rng.uniform(0.1, 0.25)
+                duration = rng.uniform(0.1, 0.25)
             else:
                 # Normal fire color transitions
                 # Random transition speed influenced by flicker_intensity
                 # Higher flicker = faster, more dramatic transitions
                 # Lower flicker = slower, more gentle transitions
-                transition_type = self.rng.random()
-                if transition_type < 0.3:
-                    # Quick flicker
-                    base_range = (0.05, 0.2)
-                elif transition_type < 0.7:
-                    # Medium transition
-                    base_range = (0.3, 0.8)
-                else:
-                    # Slow slide
-                    base_range = (1.0, 2.5)
+                # 30% quick flicker, 40% medium transition, 30% slow slide,
+                # picked by table lookup instead of an if/elif chain
+                random_ = rng.random
+                low, span = _TRANSITION_RANGES[int(random_() * 10)]
 
                 # Scale duration by flicker intensity (inverted: high flicker = short duration)
-                duration = self.rng.uniform(*base_range)
                 # Flicker intensity: 0.0 = 2x slower, 0.5 = normal, 1.0 = 2x faster
-                speed_multiplier = 2.0 - self.flicker_intensity
-                self.transition_duration = duration * speed_multiplier
+                duration = (low + span * random_()) * (2.0 - self.flicker_intensity)
+            self.transition_duration = duration
 
         # Calculate interpolation progress
-        t = elapsed / self.transition_duration if self.transition_duration > 0 else 1.0
+        t = elapsed / duration if duration > 0 else 1.0
 
         # Smooth easing (smoothstep)
         t = t * t * (3.0 - 2.0 * t)
+        if t < 0.0:
+            t = 0.0
+        elif t > 1.0:
+            t = 1.0
 
-        # Interpolate between current and target color
-        r, g, b = self.lerp_color(self.current_color, self.target_color, t)
-
-        # Apply waxing/waning intensity (sine wave)
-        self.intensity_phase += self.intensity_speed * 0.01
-        intensity_variation = (math.sin(self.intensity_phase) + 1.0) / 2.0
+        # Apply waxing/waning intensity (sine wave from _INTENSITY_WAVE)
+        phase = self.intensity_phase + self.intensity_step
+        self.intensity_phase = phase
 
         # Blend base intensity with variation
-        total_intensity = self.base_intensity * (0.6 + 0.4 * intensity_variation)
+        total_intensity = self.base_intensity * _INTENSITY_WAVE[(phase >> _WAVE_SHIFT) & _WAVE_MASK]
 
         # Wind gust / sporadic flicker effect
-        wind_multiplier = 1.0
-        if self.sporadic_flicker > 0.01:  # Only if sporadic flicker is enabled
+        sporadic_flicker = self.sporadic_flicker
+        if sporadic_flicker > 0.01:  # Only if sporadic flicker is enabled
+            gust_active = self.wind_gust_active
             # Check if we should trigger a new wind gust
-            if not self.wind_gust_active:
+            if not gust_active:
                 # Probability of triggering a gust per frame (at 60 FPS)
                 # sporadic_flicker = 0.0: never
                 # sporadic_flicker = 0.5: ~2% chance per frame = ~1x per second
                 # sporadic_flicker = 1.0: ~5% chance per frame = ~3x per second
-                gust_probability = self.sporadic_flicker * 0.05
-                if self.rng.random() < gust_probability:
+                if rng.random() < sporadic_flicker * 0.05:
                     # Trigger wind gust!
-                    self.wind_gust_active = True
+                    gust_active = self.wind_gust_active = True
                     self.wind_gust_start_time = current_time
                     # Gust duration: 0.05 to 0.4 seconds (quick drop and recovery)
-                    self.wind_gust_duration = self.rng.uniform(0.05, 0.4)
+                    self.wind_gust_duration = rng.uniform(0.05, 0.4)
                     # Intensity drop: 20% to 90% reduction
-                    self.wind_gust_intensity = self.rng.uniform(0.1, 0.8)
+                    self.wind_gust_intensity = rng.uniform(0.1, 0.8)
 
             # Apply active wind gust
-            if self.wind_gust_active:
+            if gust_active:
                 gust_elapsed = current_time - self.wind_gust_start_time
-                if gust_elapsed < self.wind_gust_duration:
+                gust_duration = self.wind_gust_duration
+                if gust_elapsed < gust_duration:
                     # During gust: ramp down then back up
-                    gust_progress = gust_elapsed / self.wind_gust_duration
+                    gust_progress = gust_elapsed / gust_duration
                     # Triangle wave: down to minimum at 0.5, back up at 1.0
-                    if gust_progress < 0.5:
-                        # Dropping (0.0 -> 0.5)
-                        wind_multiplier = 1.0 - (gust_progress * 2.0) * (1.0 - self.wind_gust_intensity)
-                    else:
-                        # Recovering (0.5 -> 1.0)
-                        wind_multiplier = self.wind_gust_intensity + ((gust_progress - 0.5) * 2.0) * (1.0 - self.wind_gust_intensity)
+                    # (|2p - 1| covers both the drop and the recovery)
+                    gust_intensity = self.wind_gust_intensity
+                    scale *= gust_intensity + (1.0 - gust_intensity) * abs(2.0 * gust_progress - 1.0)
                 else:
                     # Gust complete
                     self.wind_gust_active = False
-                    wind_multiplier = 1.0
-
-        # Apply total intensity with wind effect
-        total_intensity *= wind_multiplier
 
-        r = int(r * total_intensity)
-        g = int(g * total_intensity)
-        b = int(b * total_intensity)
+        # Apply total intensity with wind effect and the caller's scale
+        total_intensity *= scale
 
-        return (r, g, b)
+        # Interpolate between current and target color and apply the
+        # intensity in one expression per channel (one int() each)
+        r0, g0, b0 = self.current_color
+        r1, g1, b1 = self.target_color
+        return (int((r0 + (r1 - r0) * t) * total_intensity),
+                int((g0 + (g1 - g0) * t) * total_intensity),
+                int((b0 + (b1 - b0) * t) * total_intensity))
 
 
 class FlameBank:
     """A controllable bank of fire pixels."""
 
-    def __init__(self, bank_id: int, pixel_indices: List[int]):
+    def __init__(self, bank_id: int, pixel_indices: List[int], leds_per_universe: int = 512 // 3):
         self.bank_id = bank_id
         self.pixel_indices = pixel_indices
+
+        # Byte offset of each pixel's RGB triple in the output frame
+        # (universe * 512 + channel), computed once so rendering does no divmod
+        self.byte_offsets = []
+        for pixel_idx in pixel_indices:
+            universe_idx, local_pixel_idx = divmod(pixel_idx, leds_per_universe)
+            self.byte_offsets.append(universe_idx * 512 + local_pixel_idx * 3)
+
         self.intensity = 0.0  # 0.0 to 1.0
         self.target_intensity = 0.0
         self.fire_pixels = []
@@ -388,10 +530,22 @@ class FlameBank:
         self.flicker_intensity = 0.5  # 0.0 to 1.0
         self.color_shift = 0.0  # 0.0 (yellow) to 1.0 (red)
         self.sporadic_flicker = 0.0  # 0.0 (no wind gusts) to 1.0 (frequent dramatic flickers)
+        self._pixel_params = None  # Parameters last pushed to the fire pixels
 
-        # Create fire pixel objects
+        # Create fire pixel objects, all drawing from one generator per bank
+        # (a Mersenne Twister state is ~2.5 KB, too much to keep per pixel)
+        self.rng = random.Random(bank_id * 1000 + 1)
+        init_time = time.monotonic()
         for idx in pixel_indices:
-            self.fire_pixels.append(SmoothFirePixel(idx, seed=idx))
+            self.fire_pixels.append(SmoothFirePixel(idx, rng=self.rng, init_time=init_time))
+
+        # Each pixel's bound update method paired with its frame offset, so
+        # the per-frame loop does no attribute lookups or method binding
+        self._pixel_updates = [(fire_pixel.update, offset) for fire_pixel, offset
+                               in zip(self.fire_pixels, self.byte_offsets)]
+
+        # Whether this bank's pixels are already black in the output frame
+        self._frame_dark = False
 
     def set_intensity(self, dmx_value: int):
         """Set bank intensity from DMX value (0-255) with smoothing."""
@@ -406,40 +560,154 @@ class FlameBank:
         # Smooth interpolation (reduces flickering)
         self.intensity += (self.target_intensity - self.intensity) * 0.3
 
-    def update(self, current_time: float) -> Dict[int, tuple]:
+    def render(self, frame: bytearray, current_time: float, scale: float = 1.0):
         """
-        Update all pixels in this bank.
+        Update all pixels in this bank and write them into the output frame.
 
-        Returns:
-            Dict mapping pixel_index -> (r, g, b)
+        Args:
+            frame: Output frame, written at byte_offsets
+            current_time: Frame timestamp (time.monotonic())
+            scale: Extra brightness factor (master intensity), applied along
+                with the bank intensity inside each pixel's single rounding
         """
-        pixel_colors = {}
-
-        if self.intensity <= 0:
-            # Bank is off
-            for pixel_idx in self.pixel_indices:
-                pixel_colors[pixel_idx] = (0, 0, 0)
-        else:
-            # Update each fire pixel and apply intensity
+        scale *= self.intensity
+        if scale < _DARK_SCALE:
+            # Bank is off (or faded below one DMX level): black out its
+            # pixels once, then leave them
+            if not self._frame_dark:
+                for offset in self.byte_offsets:
+                    frame[offset] = frame[offset + 1] = frame[offset + 2] = 0
+                self._frame_dark = True
+            return
+        self._frame_dark = False
+
+        # Apply global fire parameters to each pixel, only when they change
+        params = (self.flicker_intensity, self.color_shift, self.sporadic_flicker)
+        if params != self._pixel_params:
             for fire_pixel in self.fire_pixels:
-                # Apply global fire parameters to each pixel
-                fire_pixel.flicker_intensity = self.flicker_intensity
-                fire_pixel.color_shift = self.color_shift
-                fire_pixel.sporadic_flicker = self.sporadic_flicker
-
-                r, g, b = fire_pixel.update(current_time)
-                # Apply bank intensity
-                r = int(r * self.intensity)
-                g = int(g * self.intensity)
-                b = int(b * self.intensity)
-                pixel_colors[fire_pixel.pixel_index] = (r, g, b)
+                (fire_pixel.flicker_intensity,
+                 fire_pixel.color_shift,
+                 fire_pixel.sporadic_flicker) = params
+            self._pixel_params = params
 
-        return pixel_colors
+        # Update each fire pixel with bank intensity (and scale) applied and
+        # store it straight into the frame
+        for update, offset in self._pixel_updates:
+            r, g, b = update(current_time, scale)
+            frame[offset] = r
+            frame[offset + 1] = g
+            frame[offset + 2] = b
 
 
 # WindEffect class removed - replaced with flicker_intensity and color_shift controls
 
 
+# ============================================================================
+# sACN (E1.31) Output
+# ============================================================================
+
+class E131Output:
+    """
+    Low-overhead sACN output with pre-serialized packets.
+
+    Each universe's E1.31 data packet is built once with sacn.DataPacket.
+    Sending a frame only bumps the sequence number and copies the 512 DMX
+    slots into the packet in place, then issues one sendto() per universe.
+    Universes whose slots have not changed are only resent as a keep-alive.
+    """
+
+    PORT = 5568
+    SEQUENCE_OFFSET = 111  # Framing layer sequence number
+    DMX_OFFSET = 126  # First DMX slot (after the start code)
+    KEEPALIVE = 1.0  # Seconds between resends of an unchanged universe
+    SEND_BUFFER = 1 << 20  # Requested SO_SNDBUF, bytes
+
+    def __init__(self, universes: List[int], use_multicast: bool = True,
+                 destination: str = '', source_name: str = 'DMX Fire Controller',
+                 multicast_ttl: int = 8):
+        """
+        Initialize the output socket and packet templates.
+
+        Args:
+            universes: sACN universe numbers, in frame order
+            use_multicast: True for multicast, False for unicast to destination
+            destination: Receiver IP address (unicast mode)
+            source_name: Source name carried in every packet
+            multicast_ttl: Multicast TTL (same default as the sacn library)
+        """
+        cid = tuple(uuid.uuid4().bytes)
+        self.universes = list(universes)
+        self.packets = []
+        self.addresses = []
+        for univ in universes:
+            packet = sacn.DataPacket(cid=cid, sourceName=source_name,
+                                     universe=univ, dmxData=_BLACKOUT)
+            self.packets.append(bytearray(packet.getBytes()))
+            address = packet.calculate_multicast_addr() if use_multicast else destination
+            self.addresses.append((address, self.PORT))
+        self.sent_times = [float('-inf')] * len(self.packets)
+        self.last_error_time = float('-inf')  # Last reported send error
+
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        # Room for a whole frame's burst of universes (the kernel clamps this
+        # to its own maximum); best effort, defaults still work
+        try:
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, self.SEND_BUFFER)
+        except OSError:
+            pass
+        if use_multicast:
+            self.socket.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_TTL, multicast_ttl)
+            # Don't loop our own packets back to this host
+            self.socket.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_LOOP, 0)
+
+    def send(self, frames, current_time: Optional[float] = None, force: bool = False) -> int:
+        """
+        Send one 512-byte frame per universe (same order as universes).
+
+        Args:
+            frames: 512-byte buffers, one per universe
+            current_time: Frame timestamp (time.monotonic()), for keep-alives
+            force: Send every universe, even those that have not changed
+
+        Returns:
+            Number of universes sent
+
+        A universe whose sendto() fails (e.g. network unreachable, no buffer
+        space) is skipped and retried with a later frame; the error is
+        reported at most once a second.
+        """
+        if current_time is None:
+            current_time = time.monotonic()
+        stale = current_time - self.KEEPALIVE
+        sendto = self.socket.sendto
+        seq = self.SEQUENCE_OFFSET
+        dmx = self.DMX_OFFSET
+        sent_times = self.sent_times
+        sent = 0
+        for i, (packet, data, address) in enumerate(zip(self.packets, frames, self.addresses)):
+            if packet[dmx:] == data:
+                # Unchanged since the last packet: only resend as a keep-alive
+                if not force and sent_times[i] > stale:
+                    continue
+            else:
+                packet[dmx:] = data
+            packet[seq] = (packet[seq] + 1) & 0xFF
+            try:
+                sendto(packet, address)
+            except OSError as e:
+                if current_time - self.last_error_time >= 1.0:
+                    print(f"\n⚠️  sACN send to universe {self.universes[i]} failed: {e}")
+                    self.last_error_time = current_time
+                continue
+            sent_times[i] = current_time
+            sent += 1
+        return sent
+
+    def close(self):
+        """Close the output socket."""
+        self.socket.close()
+
+
 # ============================================================================
 # Main Integrated Controller
 # ============================================================================
@@ -458,7 +726,8 @@ class DMXFireController:
                  output_universe_start: int,
                  total_pixels: int,
                  spacing: int = 1,
-                 use_multicast: bool = True):
+                 use_multicast: bool = True,
+                 always_send: bool = False):
         """
         Initialize the integrated controller.
 
@@ -470,6 +739,9 @@ class DMXFireController:
             total_pixels: Total number of LEDs
             spacing: Spacing between fire pixels (every Nth pixel)
             use_multicast: True for multicast (multi-WLED), False for unicast
+            always_send: Render and send every universe every frame, even
+                unchanged ones or once the output has settled to black (for
+                fixtures that need continuous DMX)
         """
         self.dmx_universe = dmx_universe
         self.output_ip = output_ip
@@ -477,6 +749,7 @@ class DMXFireController:
         self.total_pixels = total_pixels
         self.spacing = spacing
         self.use_multicast = use_multicast
+        self.always_send = always_send
 
         print(f"\n🔥 DMX Fire Controller - Low Latency Edition")
         print(f"=" * 70)
@@ -488,9 +761,12 @@ class DMXFireController:
         print(f"   Channels: 1 (Speed), 2 (Yellow←→Red), 3 (Wind), 6 (Master), 7-19 (Banks)")
         print(f"   Base Color: RGB(255, 127, 15)")
 
+        # No settle delay needed: buffered framing skips any partial or
+        # stale bytes the widget sends before it applies the receive mode
         self.dmx_input = EnttecDMXProInput(dmx_serial_port)
-        time.sleep(0.2)  # Let device initialize
         print(f"   ✓ ENTTEC DMX USB Pro ready")
+        if self.dmx_input.low_latency:
+            print(f"   ✓ USB latency timer: 1 ms")
 
         # Create flame banks (13 banks, with gap between WLED boxes)
         # WLED ONE: Banks 1-7 (125 LEDs each = 875 pixels, universes 1-6)
@@ -502,6 +778,7 @@ class DMXFireController:
         bank_sizes = [125] * 7  # WLED ONE banks
         bank_sizes += [125] * 3 + [150] * 3  # WLED TWO banks
 
+        self.leds_per_universe = 512 // 3  # 170 LEDs per universe
         self.flame_banks = []
         current_pixel = 0
 
@@ -517,7 +794,7 @@ class DMXFireController:
 
             # Every Nth pixel in this range gets fire
             pixel_indices = list(range(start_idx, end_idx, spacing))
-            self.flame_banks.append(FlameBank(bank_id + 1, pixel_indices))
+            self.flame_banks.append(FlameBank(bank_id + 1, pixel_indices, self.leds_per_universe))
 
             if bank_id == 6:
                 print(f"   Bank {bank_id + 1:2d}: {len(pixel_indices):4d} flames "
@@ -543,7 +820,6 @@ class DMXFireController:
         self.target_master_intensity = 1.0
 
         # Calculate output universes
-        self.leds_per_universe = 512 // 3  # 170 LEDs per universe
         self.num_universes = (total_pixels + self.leds_per_universe - 1) // self.leds_per_universe
 
         # Calculate bank split for dual-WLED setup
@@ -578,52 +854,120 @@ class DMXFireController:
             print(f"   Universes: {output_universe_start}-{output_universe_start + self.num_universes - 1} ({self.num_universes} total)")
         print(f"   Total LEDs: {total_pixels}")
 
-        self.sender = sacn.sACNsender()
-        self.sender.start()
-
-        for i in range(self.num_universes):
-            univ = output_universe_start + i
-            self.sender.activate_output(univ)
-            if use_multicast:
-                self.sender[univ].multicast = True
-            else:
-                self.sender[univ].multicast = False
-                self.sender[univ].destination = output_ip
+        # All universes are sent back-to-back from the render loop
+        self._universe_nums = [output_universe_start + i for i in range(self.num_universes)]
+        self.sender = E131Output(self._universe_nums, use_multicast, output_ip)
+        self._last_send_time = 0.0
 
         print(f"   ✓ sACN sender ready")
 
-        # Pre-allocate universe buffers (performance optimization)
-        self.universe_data = {}
-        for i in range(self.num_universes):
-            univ = output_universe_start + i
-            self.universe_data[univ] = [0] * 512
+        # Pre-allocate one contiguous output frame (num_universes x 512 channels)
+        # with a 512-byte view per universe. The views share the frame's memory,
+        # so rendering writes straight into the data handed to sACN.
+        # Universes are dense, so everything is indexed by universe offset
+        # (universe_idx), in the same order as self._universe_nums.
+        self.frame_buffer = bytearray(self.num_universes * 512)
+        self.universe_data = self._universe_views(self.frame_buffer)
+
+        # Transmit thread (started by run()): each rendered frame is copied
+        # into whichever of two slots the thread is not sending from, so a
+        # slow send never holds up rendering and never sees a torn frame.
+        # If the thread falls behind, only the newest frame is sent.
+        self._tx_slots = [bytearray(len(self.frame_buffer)) for _ in range(2)]
+        self._tx_slot_data = [self._universe_views(slot) for slot in self._tx_slots]
+        self._tx_cond = threading.Condition()
+        self._tx_ready = None  # Slot holding a frame not yet sent
+        self._tx_ready_time = 0.0
+        self._tx_sending = None  # Slot the transmit thread is reading
+        self._tx_thread = None
+        self._tx_thread_running = False
+
+        # Converged-output tracking: once every bank is dark and a black frame
+        # has been sent, rendering and sending are skipped until DMX changes
+        self._output_dark = False
+        self._converged = False
+
+        # DMX reader thread (started by run())
+        self._dmx_thread = None
+        self._dmx_thread_running = False
+        self._last_packet_count = 0
+        self.dmx_snapshot = bytes(512)  # Channels used for the current frame
 
         self.running = False
 
         print(f"\n" + "=" * 70)
 
+    @staticmethod
+    def _universe_views(frame: bytearray) -> List[memoryview]:
+        """512-byte view of each universe in a contiguous frame."""
+        frame_view = memoryview(frame)
+        return [frame_view[i:i + 512] for i in range(0, len(frame), 512)]
+
+    def _transmitter(self):
+        """Transmit thread: send the newest rendered frame as it is handed over."""
+        cond = self._tx_cond
+        last_error_time = float('-inf')
+        while True:
+            with cond:
+                while self._tx_ready is None and self._tx_thread_running:
+                    cond.wait()
+                if self._tx_ready is None:
+                    return  # Stopped with nothing left to send
+                slot = self._tx_sending = self._tx_ready
+                self._tx_ready = None
+                current_time = self._tx_ready_time
+            try:
+                self.sender.send(self._tx_slot_data[slot], current_time, force=self.always_send)
+            except OSError as e:
+                # Network error - drop this frame and keep sending later ones
+                # (reported at most once a second)
+                if current_time - last_error_time >= 1.0:
+                    print(f"\n⚠️  sACN send error: {e}")
+                    last_error_time = current_time
+            finally:
+                with cond:
+                    self._tx_sending = None
+
+    def _dmx_reader(self):
+        """
+        Reader thread: drain the ENTTEC as packets arrive.
+
+        poll() updates dmx_input.dmx_data in place with a single slice copy
+        and the render loop takes a snapshot() copy once per frame; both are
+        atomic under the GIL, so no lock is needed and a frame never sees
+        channels from two different packets.
+        """
+        while self._dmx_thread_running:
+            packets = self.dmx_input.poll()
+            if packets < 0:
+                time.sleep(1.0)  # Serial error (e.g. unplugged) - back off before retrying
+            elif not packets:
+                time.sleep(0.0005)
+
     def _update_from_dmx(self) -> int:
         """
-        Update control parameters from DMX input (non-blocking).
+        Update control parameters from the latest DMX values (non-blocking).
 
         Returns:
-            Number of DMX packets received
+            Number of DMX packets received since the previous update
         """
-        # Poll for new DMX data (drain buffer)
-        packets_received = self.dmx_input.poll()
+        # Packets are drained by the reader thread; just count new ones
+        packet_count = self.dmx_input.packet_count
+        packets_received = packet_count - self._last_packet_count
+        self._last_packet_count = packet_count
 
-        # Update global fire parameters from channels 1-3
-        flicker_dmx = self.dmx_input.get_channel(1)
-        color_shift_dmx = self.dmx_input.get_channel(2)
-        sporadic_flicker_dmx = self.dmx_input.get_channel(3)
+        # Consistent view of this frame's channels (index = channel - 1)
+        dmx = self.dmx_input.snapshot()
+        self.dmx_snapshot = dmx
 
+        # Update global fire parameters from channels 1-3
         # Convert DMX (0-255) to 0.0-1.0
-        self.global_flicker_intensity = flicker_dmx / 255.0
-        self.global_color_shift = color_shift_dmx / 255.0
-        self.global_sporadic_flicker = sporadic_flicker_dmx / 255.0
+        flicker = self.global_flicker_intensity = dmx[0] / 255.0
+        color_shift = self.global_color_shift = dmx[1] / 255.0
+        sporadic_flicker = self.global_sporadic_flicker = dmx[2] / 255.0
 
         # Update master intensity from channel 6
-        master_dmx = self.dmx_input.get_channel(6)
+        master_dmx = dmx[5]
         target = master_dmx / 255.0
 
         # Hysteresis for master intensity
@@ -633,49 +977,56 @@ class DMXFireController:
         # Smooth interpolation for master intensity
         self.master_intensity += (self.target_master_intensity - self.master_intensity) * 0.3
 
-        # Update flame banks from channels 7-19 (13 banks)
-        for i in range(13):
-            dmx_value = self.dmx_input.get_channel(7 + i)
-            self.flame_banks[i].set_intensity(dmx_value)
-
-        # Apply global parameters to all banks
-        for bank in self.flame_banks:
-            bank.flicker_intensity = self.global_flicker_intensity
-            bank.color_shift = self.global_color_shift
-            bank.sporadic_flicker = self.global_sporadic_flicker
+        # Update flame banks from channels 7-19 (one channel per bank) and
+        # apply the global parameters in the same pass
+        brightest = 0.0
+        banks = self.flame_banks
+        for bank, dmx_value in zip(banks, dmx[6:6 + len(banks)]):
+            bank.set_intensity(dmx_value)
+            bank.flicker_intensity = flicker
+            bank.color_shift = color_shift
+            bank.sporadic_flicker = sporadic_flicker
+            if bank.intensity > brightest:
+                brightest = bank.intensity
+
+        # Output is dark once master x brightest bank can no longer produce
+        # a non-zero channel value
+        self._output_dark = brightest * self.master_intensity < 1.0 / 255.0
 
         return packets_received
 
     def _render_frame(self, current_time: float):
         """Render one frame of fire effects."""
-        # Clear all universe buffers
-        for univ in self.universe_data:
-            self.universe_data[univ] = [0] * 512
-
-        # Update all flame banks
+        # No per-frame clear: lit banks rewrite all their pixels each frame,
+        # off banks black theirs out once and unused channels stay at the
+        # zero the buffer was allocated with
+        frame = self.frame_buffer
+        master = self.master_intensity
+
+        # Each bank writes its pixels straight into the frame, with master
+        # intensity applied inside each pixel's update
         for bank in self.flame_banks:
-            pixel_colors = bank.update(current_time)
-
-            for pixel_idx, (r, g, b) in pixel_colors.items():
-                # Apply master intensity
-                r = int(r * self.master_intensity)
-                g = int(g * self.master_intensity)
-                b = int(b * self.master_intensity)
-
-                # Calculate universe and channel
-                universe_idx = pixel_idx // self.leds_per_universe
-                local_pixel_idx = pixel_idx % self.leds_per_universe
-                univ = self.output_universe_start + universe_idx
-                channel_offset = local_pixel_idx * 3
-
-                # Set pixel color
-                self.universe_data[univ][channel_offset] = r
-                self.universe_data[univ][channel_offset + 1] = g
-                self.universe_data[univ][channel_offset + 2] = b
+            bank.render(frame, current_time, master)
 
         # Send all universe data
-        for univ, data in self.universe_data.items():
-            self.sender[univ].dmx_data = data
+        self._send_frame(current_time)
+
+    def _send_frame(self, current_time: float):
+        """Hand the frame to the transmit thread (or send it directly if not running)."""
+        self._last_send_time = current_time
+        if self._tx_thread is None:
+            # Unchanged universes are skipped (apart from keep-alives) unless
+            # --always-send is given
+            self.sender.send(self.universe_data, current_time, force=self.always_send)
+            return
+
+        with self._tx_cond:
+            # Overwrite any unsent frame, but never the one being sent
+            slot = 1 if self._tx_sending == 0 else 0
+            self._tx_slots[slot][:] = self.frame_buffer
+            self._tx_ready = slot
+            self._tx_ready_time = current_time
+            self._tx_cond.notify()
 
     def run(self, debug: bool = False):
         """
@@ -687,37 +1038,53 @@ class DMXFireController:
         print(f"\n🎭 Starting main control loop (target: 60 FPS)")
         if debug:
             print(f"   🐛 DEBUG MODE: Real-time DMX values enabled")
+        if self.always_send:
+            print(f"   📡 ALWAYS-SEND: Frames sent even when output is static")
         print(f"   Press Ctrl+C to stop\n")
 
         self.running = True
+        self._dmx_thread_running = True
+        self._dmx_thread = threading.Thread(target=self._dmx_reader,
+                                            name="dmx-reader", daemon=True)
+        self._dmx_thread.start()
+        self._tx_thread_running = True
+        self._tx_thread = threading.Thread(target=self._transmitter,
+                                           name="sacn-transmit", daemon=True)
+        self._tx_thread.start()
         frame_count = 0
-        start_time = time.time()
+        start_time = time.monotonic()
         last_report = start_time
         last_dmx_count = 0
-        target_frame_time = 1.0 / 60.0  # 60 FPS
+        frame_ns = 1_000_000_000 // 60  # 60 FPS
+        spin_ns = 1_500_000  # Final stretch before each deadline is spun, not slept
+        next_deadline_ns = time.monotonic_ns()
 
         try:
             while self.running:
-                frame_start = time.time()
+                frame_start = time.monotonic()
 
-                # 1. Update from DMX input (non-blocking, drain buffer)
+                # 1. Update from latest DMX input (drained by reader thread)
                 packets_this_frame = self._update_from_dmx()
 
-                # 2. Render fire effects
-                self._render_frame(frame_start)
+                # 2. Render fire effects (skipped while the output has
+                #    converged to black and the black frame was already sent)
+                if self.always_send or not (self._output_dark and self._converged):
+                    self._render_frame(frame_start)
+                elif frame_start - self._last_send_time >= 1.0:
+                    # Keep-alive: resend the black frame once a second
+                    self._send_frame(frame_start)
+                self._converged = self._output_dark
 
                 frame_count += 1
 
                 # Debug output every frame (if enabled)
                 if debug and frame_count % 10 == 0:  # Every 10 frames
-                    speed = self.dmx_input.get_channel(1)
-                    color = self.dmx_input.get_channel(2)
-                    wind = self.dmx_input.get_channel(3)
-                    master = self.dmx_input.get_channel(6)
+                    dmx = self.dmx_snapshot
+                    speed, color, wind, master = dmx[0], dmx[1], dmx[2], dmx[5]
                     # Show first 5 banks
-                    banks = [self.dmx_input.get_channel(7 + i) for i in range(5)]
-                    print(f"DMX: Speed:{speed:3d} Color:{color:3d} Wind:{wind:3d} Master:{master:3d} | "
-                          f"Banks 1-5: {banks[0]:3d} {banks[1]:3d} {banks[2]:3d} {banks[3]:3d} {banks[4]:3d}")
+                    banks = dmx[6:11]
+                    sys.stdout.write(f"DMX: Speed:{speed:3d} Color:{color:3d} Wind:{wind:3d} Master:{master:3d} | "
+                                     f"Banks 1-5: {banks[0]:3d} {banks[1]:3d} {banks[2]:3d} {banks[3]:3d} {banks[4]:3d}\n")
 
                 # Status report every 5 seconds
                 if frame_start - last_report >= 5.0:
@@ -730,7 +1097,7 @@ class DMXFireController:
                     last_dmx_count = dmx_packets
 
                     # Calculate latency (time since last DMX packet)
-                    dmx_latency = (time.time() - self.dmx_input.last_packet_time) * 1000  # ms
+                    dmx_latency = (time.monotonic() - self.dmx_input.last_packet_time) * 1000  # ms
 
                     # Show active banks (with threshold to avoid noise)
                     active_banks = [b for b in self.flame_banks if b.intensity > 0.01]
@@ -763,14 +1130,20 @@ class DMXFireController:
 
                     status = f"{bank_status} | {master_str} | {flicker_str} | {color_str} | {wind_str}"
 
-                    print(f"🔥 {fps:5.1f} FPS | DMX:{dmx_rate:5.1f} pkt/s | Latency:{dmx_latency:4.1f}ms | {status}")
+                    sys.stdout.write(f"🔥 {fps:5.1f} FPS | DMX:{dmx_rate:5.1f} pkt/s | Latency:{dmx_latency:4.1f}ms | {status}\n")
                     last_report = frame_start
 
-                # Sleep to maintain target frame rate
-                frame_time = time.time() - frame_start
-                sleep_time = target_frame_time - frame_time
-                if sleep_time > 0:
-                    time.sleep(sleep_time)
+                # Pace to an absolute monotonic deadline: coarse sleep, then
+                # spin the last stretch, yielding the GIL to the reader and transmit threads
+                next_deadline_ns += frame_ns
+                now_ns = time.monotonic_ns()
+                if now_ns > next_deadline_ns:
+                    next_deadline_ns = now_ns  # Running late - don't try to catch up
+                sleep_ns = next_deadline_ns - spin_ns - now_ns
+                if sleep_ns > 0:
+                    time.sleep(sleep_ns / 1e9)
+                while time.monotonic_ns() < next_deadline_ns:
+                    time.sleep(0)
 
         except KeyboardInterrupt:
             print("\n\n⚠️  Interrupted by user")
@@ -782,12 +1155,28 @@ class DMXFireController:
         print("\n🛑 Stopping controller...")
         self.running = False
 
-        # Turn off all outputs
-        for univ in self.universe_data.keys():
-            self.sender[univ].dmx_data = [0] * 512
-
-        self.sender.stop()
-        self.dmx_input.close()
+        # Stop the reader thread before the serial port is closed
+        self._dmx_thread_running = False
+        if self._dmx_thread:
+            self._dmx_thread.join(timeout=1.0)
+
+        # Let the transmit thread send its last frame, then send directly
+        with self._tx_cond:
+            self._tx_thread_running = False
+            self._tx_cond.notify()
+        if self._tx_thread:
+            self._tx_thread.join(timeout=1.0)
+            self._tx_thread = None
+
+        # Turn off all outputs (best effort - the port and socket are
+        # closed even if the blackout cannot be sent)
+        try:
+            self.sender.send([_BLACKOUT] * self.num_universes, force=True)
+        except OSError as e:
+            print(f"⚠️  Could not send blackout: {e}")
+        finally:
+            self.sender.close()
+            self.dmx_input.close()
 
         print("✅ Controller stopped")
 
@@ -799,6 +1188,7 @@ class DMXFireController:
 if __name__ == "__main__":
     # Check for debug or config flags
     debug_mode = "--debug" in sys.argv
+    always_send = "--always-send" in sys.argv
     show_config = "--config" in sys.argv
 
     # Print configuration if requested
@@ -824,7 +1214,8 @@ if __name__ == "__main__":
         output_universe_start=config.WLED_UNIVERSE_START,
         total_pixels=config.TOTAL_PIXELS,
         spacing=config.PIXEL_SPACING,
-        use_multicast=config.USE_MULTICAST
+        use_multicast=config.USE_MULTICAST,
+        always_send=always_send
     )
 
     controller.run(debug=debug_mode)
@@ -5,12 +5,26 @@ ENTTEC DMX USB Pro - Device Finder & Tester
 Cross-platform utility to find and test ENTTEC devices.
 """
 
+import os
 import platform
-import glob
 import serial
 import sys
 import time
 
+def list_dev_ports(*prefixes):
+    """List /dev entries for each name prefix, from a single directory scan."""
+    matches = {prefix: [] for prefix in prefixes}
+    try:
+        with os.scandir('/dev') as entries:
+            for entry in entries:
+                for prefix in prefixes:
+                    if entry.name.startswith(prefix):
+                        matches[prefix].append(entry.path)
+                        break
+    except OSError:
+        pass
+    return [sorted(matches[prefix]) for prefix in prefixes]
+
 def find_serial_ports():
     """Find all available serial ports on this system."""
     system = platform.system()
@@ -18,8 +32,7 @@ def find_serial_ports():
 
     if system == 'Darwin':  # macOS
         # Look for both cu and tty devices
-        cu_ports = glob.glob('/dev/cu.usbserial-*')
-        tty_ports = glob.glob('/dev/tty.usbserial-*')
+        cu_ports, tty_ports = list_dev_ports('cu.usbserial-', 'tty.usbserial-')
 
         for port in cu_ports:
             ports.append({
@@ -49,8 +62,7 @@ def find_serial_ports():
             })
 
     elif system == 'Linux':
-        usb_ports = glob.glob('/dev/ttyUSB*')
-        acm_ports = glob.glob('/dev/ttyACM*')
+        usb_ports, acm_ports = list_dev_ports('ttyUSB', 'ttyACM')
 
         for port in usb_ports:
             ports.append({
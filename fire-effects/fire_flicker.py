@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """Flickering fire effect on a single RGB pixel."""
 
+import itertools
 import time
 import random
 import sacn
@@ -40,11 +41,9 @@ def flicker_fire(wled_ip: str = "192.168.4.74",
         (100, 150, 255, 1),  # Blue flame (extremely rare - hottest part)
     ]
 
-    # Create weighted list for random selection
-    weighted_colors = []
-    for color in fire_colors:
-        r, g, b, weight = color
-        weighted_colors.extend([(r, g, b)] * weight)
+    # Palette and cumulative weights for weighted random selection
+    palette = [(r, g, b) for r, g, b, weight in fire_colors]
+    cum_weights = list(itertools.accumulate(weight for r, g, b, weight in fire_colors))
 
     print(f"🔥 Flickering fire effect on pixel {pixel_index}")
     print(f"   Universe: {universe}, IP: {wled_ip}")
@@ -54,10 +53,17 @@ def flicker_fire(wled_ip: str = "192.168.4.74",
     start_time = time.time()
     frame_count = 0
 
+    # One DMX frame reused every update (all black except our pixel); the
+    # sender copies it on assignment
+    dmx_data = bytearray(512)
+
+    # Calculate DMX channel offset (3 channels per pixel: RGB)
+    channel_offset = pixel_index * 3
+
     try:
         while time.time() - start_time < duration:
             # Pick a random fire color
-            r, g, b = random.choice(weighted_colors)
+            r, g, b = random.choices(palette, cum_weights=cum_weights)[0]
 
             # Add some randomness to intensity (flicker)
             intensity = random.uniform(0.6, 1.0)  # 60-100% brightness
@@ -65,11 +71,7 @@ def flicker_fire(wled_ip: str = "192.168.4.74",
             g = int(g * intensity)
             b = int(b * intensity)
 
-            # Calculate DMX channel offset (3 channels per pixel: RGB)
-            channel_offset = pixel_index * 3
-
-            # Prepare DMX data (512 channels, all black except our pixel)
-            dmx_data = [0] * 512
+            # Update our pixel in the DMX frame
             dmx_data[channel_offset] = r
             dmx_data[channel_offset + 1] = g
             dmx_data[channel_offset + 2] = b
@@ -94,7 +96,7 @@ def flicker_fire(wled_ip: str = "192.168.4.74",
 
     finally:
         # Turn off the pixel
-        dmx_data = [0] * 512
+        dmx_data[channel_offset:channel_offset + 3] = b'\x00\x00\x00'
         sender[universe].dmx_data = dmx_data
         sender.stop()
 
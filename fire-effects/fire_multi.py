@@ -1,43 +1,56 @@
 #!/usr/bin/env python3
 """Flickering fire effect on every 9th pixel with independent animation."""
 
+import bisect
+import heapq
+import itertools
 import time
 import random
 import sacn
+from typing import Optional
+
+# Fire color palette with weights, shared by every pixel
+FIRE_COLORS = [
+    # (R, G, B, weight)
+    (255, 60, 0, 20),    # Deep orange-red (common)
+    (255, 100, 0, 18),   # Orange (common)
+    (255, 140, 0, 15),   # Light orange (fairly common)
+    (255, 200, 0, 12),   # Yellow-orange (less common)
+    (200, 40, 0, 10),    # Dark red (less common)
+    (255, 255, 0, 8),    # Yellow (occasional)
+    (255, 255, 100, 5),  # Pale yellow (rare)
+    (255, 255, 200, 2),  # White-hot (very rare)
+    (100, 150, 255, 1),  # Blue flame (extremely rare)
+]
+
+# Palette colors and cumulative weights for weighted random selection
+_PALETTE = [(r, g, b) for r, g, b, weight in FIRE_COLORS]
+_CUM_WEIGHTS = list(itertools.accumulate(weight for r, g, b, weight in FIRE_COLORS))
+_TOTAL_WEIGHT = _CUM_WEIGHTS[-1]
+
 
 class FirePixel:
     """Individual fire pixel with its own state and timing."""
 
-    def __init__(self, pixel_index: int, seed: int):
+    # Fixed attribute set: faster attribute access and smaller objects
+    __slots__ = (
+        'pixel_index', 'rng', 'next_update', 'update_interval',
+        'base_intensity', 'current_color',
+    )
+
+    def __init__(self, pixel_index: int, seed: int = 0, rng: Optional[random.Random] = None):
         """
         Initialize a fire pixel.
 
         Args:
             pixel_index: The pixel index (0-1023)
-            seed: Random seed for this pixel's behavior
+            seed: Random seed for this pixel's behavior (only used without rng)
+            rng: Random generator shared with other pixels
         """
         self.pixel_index = pixel_index
-        self.rng = random.Random(seed)  # Independent random generator
-
-        # Fire color palette with weights
-        self.fire_colors = [
-            # (R, G, B, weight)
-            (255, 60, 0, 20),    # Deep orange-red (common)
-            (255, 100, 0, 18),   # Orange (common)
-            (255, 140, 0, 15),   # Light orange (fairly common)
-            (255, 200, 0, 12),   # Yellow-orange (less common)
-            (200, 40, 0, 10),    # Dark red (less common)
-            (255, 255, 0, 8),    # Yellow (occasional)
-            (255, 255, 100, 5),  # Pale yellow (rare)
-            (255, 255, 200, 2),  # White-hot (very rare)
-            (100, 150, 255, 1),  # Blue flame (extremely rare)
-        ]
-
-        # Create weighted list for random selection
-        self.weighted_colors = []
-        for color in self.fire_colors:
-            r, g, b, weight = color
-            self.weighted_colors.extend([(r, g, b)] * weight)
+        # Pixels normally share one generator; a private one (seeded per
+        # pixel) is only created when none is given
+        self.rng = rng if rng is not None else random.Random(seed)
 
         # Each pixel has its own update interval
         self.next_update = time.time() + self.rng.uniform(0, 0.1)
@@ -60,21 +73,38 @@ class FirePixel:
             Tuple of (R, G, B) color values
         """
         if current_time >= self.next_update:
-            # Pick a random fire color
-            r, g, b = self.rng.choice(self.weighted_colors)
+            self.recolor(current_time)
 
-            # Add flicker intensity on top of base intensity
-            flicker = self.rng.uniform(0.6, 1.0)  # 60-100% flicker
-            total_intensity = self.base_intensity * flicker
-            r = int(r * total_intensity)
-            g = int(g * total_intensity)
-            b = int(b * total_intensity)
+        return self.current_color
 
-            self.current_color = (r, g, b)
+    def recolor(self, current_time: float) -> tuple:
+        """
+        Pick a new color now and schedule the next update.
 
-            # Set next update time with variable interval
-            self.update_interval = self.rng.uniform(0.02, 0.08)
-            self.next_update = current_time + self.update_interval
+        For callers that already know the pixel is due (current_time >=
+        next_update), skipping the check in update.
+
+        Args:
+            current_time: Current timestamp
+
+        Returns:
+            Tuple of (R, G, B) color values
+        """
+        # Pick a random fire color (weighted)
+        r, g, b = _PALETTE[bisect.bisect(_CUM_WEIGHTS, self.rng.random() * _TOTAL_WEIGHT)]
+
+        # Add flicker intensity on top of base intensity
+        flicker = self.rng.uniform(0.6, 1.0)  # 60-100% flicker
+        total_intensity = self.base_intensity * flicker
+        r = int(r * total_intensity)
+        g = int(g * total_intensity)
+        b = int(b * total_intensity)
+
+        self.current_color = (r, g, b)
+
+        # Set next update time with variable interval
+        self.update_interval = self.rng.uniform(0.02, 0.08)
+        self.next_update = current_time + self.update_interval
 
         return self.current_color
 
@@ -107,10 +137,17 @@ def multi_fire(wled_ip: str = "192.168.4.74",
     print(f"   Duration: {duration}s")
     print(f"   Press Ctrl+C to stop early\n")
 
-    # Create fire pixel objects with different seeds
+    # Create fire pixel objects drawing from one shared random generator
+    # (fixed seed, so every run flickers the same way)
+    rng = random.Random(0)
     fire_pixels = []
     for idx, pixel_idx in enumerate(fire_pixel_indices):
-        fire_pixels.append(FirePixel(pixel_idx, seed=pixel_idx))
+        fire_pixels.append(FirePixel(pixel_idx, rng=rng))
+
+    # Pixels ordered by their next update time, so each frame only touches
+    # the pixels that are due (the rest keep their color in the buffers)
+    schedule = [(fire_pixel.next_update, i) for i, fire_pixel in enumerate(fire_pixels)]
+    heapq.heapify(schedule)
 
     # Calculate universes needed
     channels_per_led = 3
@@ -131,40 +168,49 @@ def multi_fire(wled_ip: str = "192.168.4.74",
         sender[univ].multicast = False
         sender[univ].destination = wled_ip
 
-    # Prepare DMX buffers for all universes
+    # One contiguous DMX frame for all universes, with a 512-byte view of each
+    frame = bytearray(num_universes * channels_per_universe)
+    frame_view = memoryview(frame)
     universe_data = {}
     for i in range(num_universes):
         univ = start_universe + i
-        universe_data[univ] = [0] * 512
+        universe_data[univ] = frame_view[i * channels_per_universe:(i + 1) * channels_per_universe]
+
+    # Each pixel's channel offset in the frame, computed once
+    pixel_offsets = []
+    for fire_pixel in fire_pixels:
+        universe_idx, local_pixel_idx = divmod(fire_pixel.pixel_index, leds_per_universe)
+        pixel_offsets.append(universe_idx * channels_per_universe + local_pixel_idx * channels_per_led)
+
+    # Each universe's sender output paired with its buffer, looked up once
+    outputs = [(sender[univ], data) for univ, data in universe_data.items()]
 
     start_time = time.time()
     frame_count = 0
     last_report = start_time
+    frame_time = 1.0 / 60.0  # Target ~60 FPS
+    next_deadline = time.monotonic()
 
     try:
         while time.time() - start_time < duration:
             current_time = time.time()
 
-            # Update all fire pixels
-            for fire_pixel in fire_pixels:
-                r, g, b = fire_pixel.update(current_time)
-
-                # Calculate which universe and channel this pixel belongs to
-                pixel_idx = fire_pixel.pixel_index
-                universe_idx = pixel_idx // leds_per_universe
-                local_pixel_idx = pixel_idx % leds_per_universe
-
-                univ = start_universe + universe_idx
-                channel_offset = local_pixel_idx * channels_per_led
+            # Update the fire pixels that are due
+            while schedule and schedule[0][0] <= current_time:
+                i = schedule[0][1]
+                fire_pixel = fire_pixels[i]
+                r, g, b = fire_pixel.recolor(current_time)
+                heapq.heapreplace(schedule, (fire_pixel.next_update, i))
 
-                # Set the pixel color in the appropriate universe buffer
-                universe_data[univ][channel_offset] = r
-                universe_data[univ][channel_offset + 1] = g
-                universe_data[univ][channel_offset + 2] = b
+                # Set the pixel color in the frame
+                channel_offset = pixel_offsets[i]
+                frame[channel_offset] = r
+                frame[channel_offset + 1] = g
+                frame[channel_offset + 2] = b
 
             # Send all universe data
-            for univ, data in universe_data.items():
-                sender[univ].dmx_data = data
+            for output, data in outputs:
+                output.dmx_data = data
 
             frame_count += 1
 
@@ -175,8 +221,13 @@ def multi_fire(wled_ip: str = "192.168.4.74",
                 print(f"🔥 {elapsed:.1f}s - {num_fire_pixels} pixels flickering @ {fps:.1f} FPS")
                 last_report = current_time
 
-            # Small sleep to prevent CPU spinning
-            time.sleep(0.001)
+            # Pace to an absolute deadline so slow frames don't add drift
+            next_deadline += frame_time
+            now = time.monotonic()
+            if now > next_deadline:
+                next_deadline = now  # Running late - don't try to catch up
+            else:
+                time.sleep(next_deadline - now)
 
     except KeyboardInterrupt:
         print("\n\n⚠️  Interrupted by user")
@@ -184,7 +235,7 @@ def multi_fire(wled_ip: str = "192.168.4.74",
     finally:
         # Turn off all pixels
         for univ in universe_data.keys():
-            sender[univ].dmx_data = [0] * 512
+            sender[univ].dmx_data = bytes(512)
         sender.stop()
 
         elapsed = time.time() - start_time
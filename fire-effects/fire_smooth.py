@@ -1,13 +1,35 @@
 #!/usr/bin/env python3
 """Smooth flickering fire effect with waxing/waning brightness."""
 
+import math
 import time
 import random
 import sacn
 
+# intensity ** 1.1 for intensity = i / 255, so color generation does a table
+# lookup instead of a math.pow call
+_GREEN_CURVE = tuple((i / 255.0) ** 1.1 for i in range(256))
+
+# (sin(phase) + 1) / 2 over one period, so the waxing/waning intensity is a
+# table lookup: index = int(phase * _WAVE_SCALE) & (_WAVE_SIZE - 1)
+_WAVE_SIZE = 1024
+_WAVE_SCALE = _WAVE_SIZE / (2.0 * math.pi)
+_WAVE = tuple((math.sin(2.0 * math.pi * i / _WAVE_SIZE) + 1.0) / 2.0 for i in range(_WAVE_SIZE))
+
+# Rare special colors (white-hot and blue flame flashes)
+_WHITE_HOT = (255, 255, 200)
+_BLUE_FLAME = (100, 150, 255)
+
 class SmoothFirePixel:
     """Individual fire pixel with smooth transitions and waxing/waning intensity."""
 
+    # Fixed attribute set: faster attribute access and smaller objects
+    __slots__ = (
+        'pixel_index', 'rng',
+        'current_color', 'target_color', 'transition_start_time', 'transition_duration',
+        'base_intensity', 'intensity_phase', 'intensity_speed',
+    )
+
     def __init__(self, pixel_index: int, seed: int):
         """
         Initialize a fire pixel.
@@ -19,22 +41,6 @@ class SmoothFirePixel:
         self.pixel_index = pixel_index
         self.rng = random.Random(seed)
 
-        # Use algorithm-based colors inspired by real candle physics
-        # Rather than discrete palette, we'll generate colors dynamically
-        # based on intensity using the relationship: green fades faster than red
-        self.use_algorithmic_color = True
-
-        # Rare special colors (white-hot and blue flame flashes)
-        self.special_colors = [
-            (255, 255, 200, 2),  # White-hot (very rare)
-            (100, 150, 255, 1),  # Blue flame (extremely rare)
-        ]
-
-        # Track when to use special colors
-        self.special_color_active = False
-        self.special_color = None
-        self.special_color_end_time = 0
-
         # Color transition state
         self.current_color = (0, 0, 0)
         self.target_color = self._generate_fire_color()
@@ -54,15 +60,13 @@ class SmoothFirePixel:
         Returns:
             Tuple of (R, G, B)
         """
-        import math
-
         # Check for rare special color flash (1% chance)
         if self.rng.random() < 0.01:
             # Pick white-hot or blue flame
             if self.rng.random() < 0.67:  # 2/3 chance white, 1/3 blue
-                return (255, 255, 200)  # White-hot
+                return _WHITE_HOT
             else:
-                return (100, 150, 255)  # Blue flame
+                return _BLUE_FLAME
 
         # Normal fire color generation
         # Most common: orange-yellow
@@ -79,31 +83,13 @@ class SmoothFirePixel:
         # Occasional: 30-40% (red-orange) or 70-80% (yellow)
         green_intensity = self.rng.gauss(0.55, 0.15)  # Normal dist, mean=55%, std=15%
         green_intensity = max(0.3, min(0.8, green_intensity))  # Clamp to 30-80%
-        green = int(255 * green_intensity * math.pow(intensity, 1.1))
+        green = int(255 * green_intensity * _GREEN_CURVE[int(intensity * 255)])
 
         # Blue: none (realistic candle has no blue)
         blue = 0
 
         return (red, green, blue)
 
-    def lerp_color(self, c1: tuple, c2: tuple, t: float) -> tuple:
-        """
-        Linear interpolation between two colors.
-
-        Args:
-            c1: Starting color (R, G, B)
-            c2: Target color (R, G, B)
-            t: Interpolation factor (0.0 to 1.0)
-
-        Returns:
-            Interpolated color (R, G, B)
-        """
-        t = max(0.0, min(1.0, t))  # Clamp to [0, 1]
-        r = int(c1[0] + (c2[0] - c1[0]) * t)
-        g = int(c1[1] + (c2[1] - c1[1]) * t)
-        b = int(c1[2] + (c2[2] - c1[2]) * t)
-        return (r, g, b)
-
     def update(self, current_time: float) -> tuple:
         """
         Update the pixel color with smooth transitions.
@@ -136,15 +122,22 @@ class SmoothFirePixel:
 
         # Smooth easing (ease-in-out)
         t = t * t * (3.0 - 2.0 * t)  # Smoothstep function
+        if t > 1.0:  # Clamp to [0, 1]
+            t = 1.0
+        elif t < 0.0:
+            t = 0.0
 
         # Interpolate between current and target color
-        r, g, b = self.lerp_color(self.current_color, self.target_color, t)
+        r1, g1, b1 = self.current_color
+        r2, g2, b2 = self.target_color
+        r = int(r1 + (r2 - r1) * t)
+        g = int(g1 + (g2 - g1) * t)
+        b = int(b1 + (b2 - b1) * t)
 
         # Apply waxing/waning intensity
-        # Use sine wave for smooth oscillation
-        import math
+        # Use sine wave (from the _WAVE table) for smooth oscillation
         self.intensity_phase += self.intensity_speed * 0.01  # Increment phase
-        intensity_variation = (math.sin(self.intensity_phase) + 1.0) / 2.0  # 0.0 to 1.0
+        intensity_variation = _WAVE[int(self.intensity_phase * _WAVE_SCALE) & (_WAVE_SIZE - 1)]  # 0.0 to 1.0
 
         # Blend base intensity with variation
         total_intensity = self.base_intensity * (0.6 + 0.4 * intensity_variation)
@@ -206,40 +199,45 @@ def smooth_fire(wled_ip: str = "192.168.4.74",
         sender[univ].multicast = False
         sender[univ].destination = wled_ip
 
-    # Prepare DMX buffers
+    # One contiguous DMX frame for all universes, with a 512-byte view of each
+    frame = bytearray(num_universes * 512)
+    frame_view = memoryview(frame)
     universe_data = {}
     for i in range(num_universes):
         univ = start_universe + i
-        universe_data[univ] = [0] * 512
+        universe_data[univ] = frame_view[i * 512:(i + 1) * 512]
+
+    # Each pixel's channel offset in the frame, computed once
+    pixel_offsets = []
+    for fire_pixel in fire_pixels:
+        universe_idx, local_pixel_idx = divmod(fire_pixel.pixel_index, leds_per_universe)
+        pixel_offsets.append(universe_idx * 512 + local_pixel_idx * channels_per_led)
+
+    # Each universe's sender output paired with its buffer, looked up once
+    outputs = [(sender[univ], data) for univ, data in universe_data.items()]
 
     start_time = time.time()
     frame_count = 0
     last_report = start_time
+    frame_time = 1.0 / 60.0  # Target ~60 FPS
+    next_deadline = time.monotonic()
 
     try:
         while time.time() - start_time < duration:
             current_time = time.time()
 
             # Update all fire pixels
-            for fire_pixel in fire_pixels:
+            for fire_pixel, channel_offset in zip(fire_pixels, pixel_offsets):
                 r, g, b = fire_pixel.update(current_time)
 
-                # Calculate universe and channel
-                pixel_idx = fire_pixel.pixel_index
-                universe_idx = pixel_idx // leds_per_universe
-                local_pixel_idx = pixel_idx % leds_per_universe
-
-                univ = start_universe + universe_idx
-                channel_offset = local_pixel_idx * channels_per_led
-
                 # Set pixel color
-                universe_data[univ][channel_offset] = r
-                universe_data[univ][channel_offset + 1] = g
-                universe_data[univ][channel_offset + 2] = b
+                frame[channel_offset] = r
+                frame[channel_offset + 1] = g
+                frame[channel_offset + 2] = b
 
             # Send all universe data
-            for univ, data in universe_data.items():
-                sender[univ].dmx_data = data
+            for output, data in outputs:
+                output.dmx_data = data
 
             frame_count += 1
 
@@ -250,8 +248,13 @@ def smooth_fire(wled_ip: str = "192.168.4.74",
                 print(f"🔥 {elapsed:.1f}s - {num_fire_pixels} pixels burning @ {fps:.1f} FPS")
                 last_report = current_time
 
-            # Target ~60 FPS for smooth animation
-            time.sleep(1.0 / 60.0)
+            # Pace to an absolute deadline so slow frames don't add drift
+            next_deadline += frame_time
+            now = time.monotonic()
+            if now > next_deadline:
+                next_deadline = now  # Running late - don't try to catch up
+            else:
+                time.sleep(next_deadline - now)
 
     except KeyboardInterrupt:
         print("\n\n⚠️  Interrupted by user")
@@ -259,7 +262,7 @@ def smooth_fire(wled_ip: str = "192.168.4.74",
     finally:
         # Turn off all pixels
         for univ in universe_data.keys():
-            sender[univ].dmx_data = [0] * 512
+            sender[univ].dmx_data = bytes(512)
         sender.stop()
 
         elapsed = time.time() - start_time
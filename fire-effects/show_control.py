@@ -16,13 +16,16 @@ Flame Banks divide the 1024 LEDs into controllable zones.
 import sacn
 import time
 import threading
-from typing import Dict, List, Optional
+import queue
+from typing import List, Optional
 from fire_smooth import SmoothFirePixel
 
 
 class FlameBank:
     """A controllable bank of fire pixels."""
 
+    __slots__ = ('bank_id', 'pixel_indices', 'intensity', 'dark', 'fire_pixels')
+
     def __init__(self, bank_id: int, pixel_indices: List[int]):
         """
         Initialize a flame bank.
@@ -34,6 +37,7 @@ class FlameBank:
         self.bank_id = bank_id
         self.pixel_indices = pixel_indices
         self.intensity = 0.0  # 0.0 to 1.0
+        self.dark = False  # True once black has been written for an off bank
         self.fire_pixels = []
 
         # Create fire pixel objects
@@ -44,35 +48,55 @@ class FlameBank:
         """Set bank intensity from DMX value (0-255)."""
         self.intensity = dmx_value / 255.0
 
-    def update(self, current_time: float) -> Dict[int, tuple]:
+    def render(self, current_time: float, frame: bytearray, pixel_offsets: List[int],
+               pixel_positions: List[float], wind: 'WindEffect'):
         """
-        Update all pixels in this bank.
+        Update all pixels in this bank and write them into the output frame.
 
-        Returns:
-            Dict mapping pixel_index -> (r, g, b)
+        Args:
+            current_time: Current timestamp
+            frame: Contiguous DMX data of all output universes
+            pixel_offsets: Channel offset of each pixel in frame, in
+                pixel_indices order
+            pixel_positions: Position of each pixel along the strip (0.0 to 1.0)
+            wind: Wind effect applied on top of the bank intensity
         """
-        pixel_colors = {}
-
-        if self.intensity <= 0:
-            # Bank is off, return black for all pixels
-            for pixel_idx in self.pixel_indices:
-                pixel_colors[pixel_idx] = (0, 0, 0)
-        else:
-            # Update each fire pixel and apply intensity
-            for fire_pixel in self.fire_pixels:
-                r, g, b = fire_pixel.update(current_time)
+        intensity = self.intensity
+        if intensity <= 0:
+            # Bank is off, write black for all pixels once and then leave
+            # the frame alone until it comes back on
+            if not self.dark:
+                for channel_offset in pixel_offsets:
+                    frame[channel_offset] = frame[channel_offset + 1] = frame[channel_offset + 2] = 0
+                self.dark = True
+            return
+        self.dark = False
+
+        wind_modifiers = wind.get_modifiers(pixel_positions)
+        full = intensity >= 1.0  # Bank at full, no intensity scaling needed
+
+        # Update each fire pixel, apply bank intensity and wind, and store
+        # it straight into the frame
+        for fire_pixel, channel_offset, wind_modifier in zip(
+                self.fire_pixels, pixel_offsets, wind_modifiers):
+            r, g, b = fire_pixel.update(current_time)
+            if not full:
                 # Apply bank intensity
-                r = int(r * self.intensity)
-                g = int(g * self.intensity)
-                b = int(b * self.intensity)
-                pixel_colors[fire_pixel.pixel_index] = (r, g, b)
+                r = int(r * intensity)
+                g = int(g * intensity)
+                b = int(b * intensity)
 
-        return pixel_colors
+            # Apply wind effect
+            frame[channel_offset] = int(r * wind_modifier)
+            frame[channel_offset + 1] = int(g * wind_modifier)
+            frame[channel_offset + 2] = int(b * wind_modifier)
 
 
 class WindEffect:
     """Simulates wind gusts moving across flame banks."""
 
+    __slots__ = ('intensity', 'speed', 'position', 'last_update')
+
     def __init__(self):
         self.intensity = 0.0  # 0.0 to 1.0
         self.speed = 0.5  # 0.0 to 1.0
@@ -87,9 +111,28 @@ class WindEffect:
         """Set wind speed from DMX value (0-255)."""
         self.speed = dmx_value / 255.0
 
+    def tick(self, current_time: float):
+        """
+        Advance the wind position once per frame.
+
+        Args:
+            current_time: Frame timestamp shared by all pixels
+        """
+        elapsed = current_time - self.last_update
+        self.last_update = current_time
+
+        if self.intensity <= 0:
+            return  # No wind, position holds
+
+        # Wind moves across the strip
+        self.position += self.speed * elapsed * 0.5  # 0.5 = base speed scaling
+        if self.position > 1.0:
+            self.position = 0.0
+
     def get_modifier(self, pixel_index: int, total_pixels: int) -> float:
         """
-        Get wind intensity modifier for a specific pixel.
+        Get wind intensity modifier for a specific pixel at the current
+        wind position (see tick).
 
         Args:
             pixel_index: The pixel index
@@ -101,16 +144,6 @@ class WindEffect:
         if self.intensity <= 0:
             return 1.0  # No wind effect
 
-        # Update wind position based on speed
-        current_time = time.time()
-        elapsed = current_time - self.last_update
-        self.last_update = current_time
-
-        # Wind moves across the strip
-        self.position += self.speed * elapsed * 0.5  # 0.5 = base speed scaling
-        if self.position > 1.0:
-            self.position = 0.0
-
         # Calculate how close this pixel is to the wind position
         pixel_position = pixel_index / total_pixels
         distance = abs(pixel_position - self.position)
@@ -126,6 +159,37 @@ class WindEffect:
 
         return 1.0  # Outside wind zone
 
+    def get_modifiers(self, pixel_positions: List[float]) -> List[float]:
+        """
+        Get wind intensity modifiers for many pixels at once.
+
+        Same result as calling get_modifier for each pixel, but the wind
+        width and strength are worked out once per call.
+
+        Args:
+            pixel_positions: Pixel positions along the strip (0.0 to 1.0)
+
+        Returns:
+            Modifier values (0.0 to 1.0), in pixel_positions order
+        """
+        if self.intensity <= 0:
+            return [1.0] * len(pixel_positions)  # No wind effect
+
+        position = self.position
+        intensity = self.intensity
+        wind_width = 0.1 + (intensity * 0.2)  # 10-30% of strip width
+
+        modifiers = []
+        for pixel_position in pixel_positions:
+            distance = abs(pixel_position - position)
+            if distance < wind_width:
+                # Within wind zone - reduce intensity (flicker down)
+                proximity = 1.0 - (distance / wind_width)
+                modifiers.append(1.0 - proximity * intensity * 0.7)
+            else:
+                modifiers.append(1.0)
+        return modifiers
+
 
 class FireShowControl:
     """Main show control system for fire effects."""
@@ -165,6 +229,10 @@ class FireShowControl:
         # Wind effect
         self.wind = WindEffect()
 
+        # Control packets are queued by the receiver thread and applied by
+        # the render thread, so bank and wind state only change between frames
+        self._control_queue = queue.SimpleQueue()
+
         # sACN receiver for control
         self.receiver = sacn.sACNreceiver()
         self.receiver.start()
@@ -173,7 +241,7 @@ class FireShowControl:
         # Register callback for control universe
         @self.receiver.listen_on('universe', universe=control_universe)
         def control_callback(packet):
-            self._handle_control_dmx(packet.dmxData)
+            self._control_queue.put(packet.dmxData)
 
         # sACN sender for output
         self.sender = sacn.sACNsender()
@@ -193,6 +261,18 @@ class FireShowControl:
         self.running = False
         self.render_thread = None
 
+    def _apply_control_updates(self):
+        """Apply the newest queued control packet, if any (render thread)."""
+        dmx_data = None
+        try:
+            while True:
+                dmx_data = self._control_queue.get_nowait()
+        except queue.Empty:
+            pass
+
+        if dmx_data is not None:
+            self._handle_control_dmx(dmx_data)
+
     def _handle_control_dmx(self, dmx_data: list):
         """Handle incoming DMX control data."""
         # Channels are 1-indexed in DMX, but 0-indexed in array
@@ -213,48 +293,53 @@ class FireShowControl:
         """Main render loop - updates and outputs fire effects."""
         leds_per_universe = 512 // 3
 
-        # Prepare universe buffers
+        # One contiguous DMX frame for all universes, with a 512-byte view of
+        # each. It is never cleared: fire pixels are rewritten each frame
+        # (banks that are off are blacked out once) and all other channels
+        # stay zero
+        frame = bytearray(self.num_universes * 512)
+        frame_view = memoryview(frame)
         universe_data = {}
         for i in range(self.num_universes):
             univ = self.output_universe_start + i
-            universe_data[univ] = [0] * 512
+            universe_data[univ] = frame_view[i * 512:(i + 1) * 512]
+
+        # Frame channel offset and strip position of every fire pixel, per
+        # bank, computed once
+        bank_outputs = []
+        for bank in self.flame_banks:
+            pixel_offsets = []
+            for pixel_idx in bank.pixel_indices:
+                universe_idx, local_pixel_idx = divmod(pixel_idx, leds_per_universe)
+                pixel_offsets.append(universe_idx * 512 + local_pixel_idx * 3)
+            pixel_positions = [pixel_idx / self.total_pixels for pixel_idx in bank.pixel_indices]
+            bank_outputs.append((pixel_offsets, pixel_positions))
+
+        # Sender output of each universe paired with its buffer, looked up once
+        outputs = [(self.sender[univ], data) for univ, data in universe_data.items()]
 
         frame_count = 0
         start_time = time.time()
         last_report = start_time
+        frame_time = 1.0 / 60.0  # Target ~60 FPS
+        next_deadline = time.monotonic()
 
         while self.running:
             current_time = time.time()
 
-            # Clear all universe buffers
-            for univ in universe_data:
-                universe_data[univ] = [0] * 512
-
-            # Update all flame banks
-            for bank in self.flame_banks:
-                pixel_colors = bank.update(current_time)
-
-                for pixel_idx, (r, g, b) in pixel_colors.items():
-                    # Apply wind effect
-                    wind_modifier = self.wind.get_modifier(pixel_idx, self.total_pixels)
-                    r = int(r * wind_modifier)
-                    g = int(g * wind_modifier)
-                    b = int(b * wind_modifier)
+            # Pick up control changes received since the last frame
+            self._apply_control_updates()
 
-                    # Calculate universe and channel
-                    universe_idx = pixel_idx // leds_per_universe
-                    local_pixel_idx = pixel_idx % leds_per_universe
-                    univ = self.output_universe_start + universe_idx
-                    channel_offset = local_pixel_idx * 3
+            # Move the wind once per frame, before any pixel reads it
+            self.wind.tick(current_time)
 
-                    # Set pixel color
-                    universe_data[univ][channel_offset] = r
-                    universe_data[univ][channel_offset + 1] = g
-                    universe_data[univ][channel_offset + 2] = b
+            # Update all flame banks, each writing into the frame
+            for bank, (pixel_offsets, pixel_positions) in zip(self.flame_banks, bank_outputs):
+                bank.render(current_time, frame, pixel_offsets, pixel_positions, self.wind)
 
             # Send all universe data
-            for univ, data in universe_data.items():
-                self.sender[univ].dmx_data = data
+            for output, data in outputs:
+                output.dmx_data = data
 
             frame_count += 1
 
@@ -275,8 +360,13 @@ class FireShowControl:
                 print(f"🔥 {fps:.1f} FPS | {status}")
                 last_report = current_time
 
-            # Target ~60 FPS
-            time.sleep(1.0 / 60.0)
+            # Pace to an absolute deadline so slow frames don't add drift
+            next_deadline += frame_time
+            now = time.monotonic()
+            if now > next_deadline:
+                next_deadline = now  # Running late - don't try to catch up
+            else:
+                time.sleep(next_deadline - now)
 
     def start(self):
         """Start the show control system."""
@@ -306,7 +396,7 @@ class FireShowControl:
         # Turn off all outputs
         for i in range(self.num_universes):
             univ = self.output_universe_start + i
-            self.sender[univ].dmx_data = [0] * 512
+            self.sender[univ].dmx_data = bytes(512)
 
         self.sender.stop()
         self.receiver.stop()
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """Test script for 1024 RGB LED fixture via sACN."""
 
+import random
 import time
 from claude_lights.controller import WLEDController
 from claude_lights.states import StateAnimation, Color
@@ -59,11 +60,8 @@ def rainbow_wave(led_count: int = 1024):
 
         # Test 3: Sparkle effect
         print("\nSparkle effect...")
-        import random
         for _ in range(100):  # 100 sparkles
-            r = random.randint(0, 255)
-            g = random.randint(0, 255)
-            b = random.randint(0, 255)
+            r, g, b = random.randbytes(3)  # Random color, one draw
             controller.set_solid_color((r, g, b))
             time.sleep(0.05)
 
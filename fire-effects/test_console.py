@@ -6,10 +6,30 @@ Simulates a lighting console sending DMX control signals.
 Provides preset scenes and interactive control.
 """
 
+import math
+import random
 import sacn
 import time
 import sys
 
+# DMX level of (sin(phase) + 1) / 2 over one period, so the wave scene is a
+# table lookup: index = int(phase * _WAVE_SCALE) & (_WAVE_SIZE - 1)
+_WAVE_SIZE = 1024
+_WAVE_SCALE = _WAVE_SIZE / (2.0 * math.pi)
+_WAVE_DMX = bytes(int((math.sin(2.0 * math.pi * i / _WAVE_SIZE) + 1) / 2 * 255)
+                  for i in range(_WAVE_SIZE))
+
+# Channels 1-6 (banks 1-4, wind intensity, wind speed) of the static scenes
+_SCENE_OFF = bytes(6)
+_SCENE_FULL = bytes((
+    255, 255, 255, 255,  # Banks 1-4
+    0,                   # Wind off
+    0,                   # Wind speed
+))
+
+# Bank 1-4 levels for each step of the fade scene (0, 5, ..., 255)
+_FADE_STEPS = [bytes((level,)) * 4 for level in range(0, 256, 5)]
+
 
 class TestConsole:
     """Simulated lighting console for testing fire effects."""
@@ -29,24 +49,51 @@ class TestConsole:
         self.sender.activate_output(control_universe)
         self.sender[control_universe].multicast = True  # Use multicast for local testing
 
-        # Current DMX values
-        self.dmx = [0] * 512
+        # Current DMX values: one persistent buffer, edited in place and
+        # handed to sacn as is by send()
+        self.dmx = bytearray(512)
+        self.dirty = True  # DMX values changed since the last send()
 
         print(f"🎛️  Test Console initialized on Universe {control_universe}")
 
     def set_channel(self, channel: int, value: int):
         """Set a DMX channel value (1-indexed)."""
-        self.dmx[channel - 1] = max(0, min(255, value))
+        value = 0 if value < 0 else 255 if value > 255 else value
+        if self.dmx[channel - 1] != value:
+            self.dmx[channel - 1] = value
+            self.dirty = True
+
+    def set_many(self, channel: int, values: bytes):
+        """Set consecutive DMX channels starting at channel (1-indexed)."""
+        end = channel - 1 + len(values)
+        if self.dmx[channel - 1:end] != values:
+            self.dmx[channel - 1:end] = values
+            self.dirty = True
+
+    def send(self, force: bool = False):
+        """
+        Send current DMX values.
 
-    def send(self):
-        """Send current DMX values."""
+        Skipped when nothing changed since the last send (sacn keeps
+        retransmitting the last values on its own) unless force is set.
+        """
+        if not (self.dirty or force):
+            return
         self.sender[self.control_universe].dmx_data = self.dmx
+        self.dirty = False
+
+    @staticmethod
+    def _sleep_until(deadline: float):
+        """Sleep until a time.monotonic() deadline (returns at once if past)."""
+        remaining = deadline - time.monotonic()
+        if remaining > 0:
+            time.sleep(remaining)
 
     def stop(self):
         """Stop the console."""
-        # Send all zeros
-        self.dmx = [0] * 512
-        self.send()
+        # Send all zeros (cleared in place, the buffer is never replaced)
+        self.dmx[:] = bytes(512)
+        self.send(force=True)
         self.sender.stop()
 
     # ===== Preset Scenes =====
@@ -54,19 +101,13 @@ class TestConsole:
     def scene_all_off(self):
         """Turn all flame banks off."""
         print("Scene: ALL OFF")
-        for ch in range(1, 7):
-            self.set_channel(ch, 0)
+        self.set_many(1, _SCENE_OFF)
         self.send()
 
     def scene_all_full(self):
         """All flame banks at full intensity."""
         print("Scene: ALL FULL")
-        self.set_channel(1, 255)  # Bank 1
-        self.set_channel(2, 255)  # Bank 2
-        self.set_channel(3, 255)  # Bank 3
-        self.set_channel(4, 255)  # Bank 4
-        self.set_channel(5, 0)    # Wind off
-        self.set_channel(6, 0)    # Wind speed
+        self.set_many(1, _SCENE_FULL)
         self.send()
 
     def scene_banks_sequential(self, intensity: int = 200):
@@ -74,21 +115,28 @@ class TestConsole:
         print(f"Scene: BANKS SEQUENTIAL @ {intensity}")
         banks = [1, 2, 3, 4]
 
+        # Steps land every 2 seconds on an absolute schedule, so send and
+        # print time doesn't stretch the scene
+        deadline = time.monotonic()
+
         for bank_ch in banks:
             # Turn on this bank
             self.set_channel(bank_ch, intensity)
             self.send()
             print(f"  Bank {bank_ch} ON")
-            time.sleep(2)
+            deadline += 2
+            self._sleep_until(deadline)
 
-        time.sleep(2)
+        deadline += 2
+        self._sleep_until(deadline)
 
         # Turn off in reverse
         for bank_ch in reversed(banks):
             self.set_channel(bank_ch, 0)
             self.send()
             print(f"  Bank {bank_ch} OFF")
-            time.sleep(2)
+            deadline += 2
+            self._sleep_until(deadline)
 
     def scene_wave(self, duration: int = 30):
         """Wave pattern - banks fade in and out in sequence."""
@@ -98,15 +146,13 @@ class TestConsole:
         while time.time() - start_time < duration:
             elapsed = time.time() - start_time
             # Each bank gets a sine wave offset by 90 degrees
-            import math
-
+            levels = bytearray(4)
             for bank_id in range(1, 5):
-                # Sine wave for this bank
+                # Sine wave for this bank (from the _WAVE_DMX table)
                 phase = (elapsed + (bank_id - 1) * 2) * 0.5  # Offset each bank
-                intensity = (math.sin(phase) + 1) / 2  # 0 to 1
-                dmx_value = int(intensity * 255)
-                self.set_channel(bank_id, dmx_value)
+                levels[bank_id - 1] = _WAVE_DMX[int(phase * _WAVE_SCALE) & (_WAVE_SIZE - 1)]  # 0 to 255
 
+            self.set_many(1, levels)
             self.send()
             time.sleep(0.05)
 
@@ -117,8 +163,7 @@ class TestConsole:
         print(f"Scene: WIND GUST (intensity={wind_intensity}, speed={wind_speed})")
 
         # Turn on all banks
-        for bank_ch in range(1, 5):
-            self.set_channel(bank_ch, 200)
+        self.set_many(1, bytes((200,)) * 4)
 
         # Set wind
         self.set_channel(5, wind_intensity)
@@ -142,13 +187,21 @@ class TestConsole:
         for bank_ch in range(1, 5):
             self.set_channel(bank_ch, 220)
 
-        start_time = time.time()
-        import random
-
-        while time.time() - start_time < duration:
-            # Random wind gusts
+        # Random wind gusts, drawn up front until they cover the duration
+        gusts = []
+        planned = 0.0
+        while planned < duration:
             wind_intensity = random.randint(100, 255)
             wind_speed = random.randint(80, 200)
+            gust_time = random.uniform(1, 4)  # Random duration for this gust
+            gusts.append((wind_intensity, wind_speed, gust_time))
+            planned += gust_time
+
+        start_time = time.time()
+
+        for wind_intensity, wind_speed, gust_time in gusts:
+            if time.time() - start_time >= duration:
+                break  # Sleeps ran long, storm is over
 
             self.set_channel(5, wind_intensity)
             self.set_channel(6, wind_speed)
@@ -156,8 +209,7 @@ class TestConsole:
 
             print(f"  Gust: intensity={wind_intensity}, speed={wind_speed}")
 
-            # Random duration for this gust
-            time.sleep(random.uniform(1, 4))
+            time.sleep(gust_time)
 
         # Calm down
         print("  Storm ending...")
@@ -171,23 +223,23 @@ class TestConsole:
         """Fade all banks in and out."""
         print(f"Scene: FADE IN/OUT ({duration}s each direction)")
 
+        step_time = duration / (256 / 5)
+
         # Fade in
         print("  Fading in...")
-        for level in range(0, 256, 5):
-            for bank_ch in range(1, 5):
-                self.set_channel(bank_ch, level)
+        for banks in _FADE_STEPS:
+            self.set_many(1, banks)
             self.send()
-            time.sleep(duration / (256 / 5))
+            time.sleep(step_time)
 
         time.sleep(2)
 
-        # Fade out
+        # Fade out (255 down to 0, the same steps in reverse)
         print("  Fading out...")
-        for level in range(255, -1, -5):
-            for bank_ch in range(1, 5):
-                self.set_channel(bank_ch, level)
+        for banks in reversed(_FADE_STEPS):
+            self.set_many(1, banks)
             self.send()
-            time.sleep(duration / (256 / 5))
+            time.sleep(step_time)
 
     # ===== Interactive Control =====
 
@@ -7,6 +7,7 @@ import serial
 import struct
 import time
 import sys
+import select
 
 # Import configuration
 try:
@@ -16,11 +17,18 @@ except ImportError:
     class config:
         DMX_SERIAL_PORT = '/dev/cu.usbserial-EN437698'
 
+# Live display text of every channel value (0-255), formatted once
+_VALUE_TEXT = [f'{v:3d}' for v in range(256)]
+
 class EnttecDMXProInput:
     START_DELIMITER = 0x7E
     END_DELIMITER = 0xE7
     LABEL_RECEIVED_DMX = 0x05
     LABEL_SET_RECEIVE_MODE = 0x08
+    MAX_PAYLOAD = 600  # Largest payload the widget sends (DMX + status byte)
+    _HEADER_STRUCT = struct.Struct('<BH')  # Label, then little-endian length
+    # Label 8 request: length 1, mode 0 = always send (framing built once)
+    RECEIVE_MODE_MESSAGE = bytes([0x7E, 0x08, 0x01, 0x00, 0x00, 0xE7])
 
     def __init__(self, port_name, baudrate=115200):
         print(f"Opening serial port: {port_name}")
@@ -38,9 +46,18 @@ class EnttecDMXProInput:
             print(f"✗ Failed to open serial port: {e}")
             sys.exit(1)
 
-        self.dmx_data = [0] * 512
+        self.dmx_data = bytearray(512)
         self.packet_count = 0
         self.last_update = time.time()
+        self.rxbuf = bytearray()  # Bytes read from the port but not yet parsed
+
+        # Serial fd for select() so poll() can wait for data, as pyserial
+        # itself does on POSIX (select.poll doesn't support devices on
+        # macOS). Windows has no fd here and falls back to sleeping.
+        try:
+            self.fd = self.port.fileno()
+        except (AttributeError, OSError, ValueError):
+            self.fd = None
 
         print("Enabling DMX receive mode...")
         self.enable_always_receive()
@@ -49,53 +66,41 @@ class EnttecDMXProInput:
 
     def enable_always_receive(self):
         """Send Label 8 to enable always-send mode"""
-        message = bytes([
-            self.START_DELIMITER,
-            self.LABEL_SET_RECEIVE_MODE,
-            0x01, 0x00,  # Length: 1 byte
-            0x00,        # Mode: 0 = always send
-            self.END_DELIMITER
-        ])
-        self.port.write(message)
+        self.port.write(self.RECEIVE_MODE_MESSAGE)
 
     def read_message(self):
-        """Read a single message from the device"""
-        # Wait for start delimiter
-        timeout_counter = 0
-        while timeout_counter < 100:
-            byte = self.port.read(1)
-            if not byte:
-                timeout_counter += 1
+        """Parse a single message from the receive buffer (None if incomplete)"""
+        rxbuf = self.rxbuf
+        while True:
+            # Find start delimiter; anything before it is noise
+            start = rxbuf.find(self.START_DELIMITER)
+            if start < 0:
+                rxbuf.clear()
+                return None
+            if start:
+                del rxbuf[:start]
+
+            # Need start, label and 2-byte length (little-endian)
+            if len(rxbuf) < 4:
+                return None
+            label, length = self._HEADER_STRUCT.unpack_from(rxbuf, 1)
+            if length > self.MAX_PAYLOAD:
+                del rxbuf[:1]  # 0x7E inside data, not a real message - resync
                 continue
-            if byte[0] == self.START_DELIMITER:
-                break
-            timeout_counter += 1
-        else:
-            return None
-
-        # Read label
-        label_byte = self.port.read(1)
-        if not label_byte:
-            return None
-        label = label_byte[0]
-
-        # Read length (2 bytes, little-endian)
-        length_bytes = self.port.read(2)
-        if len(length_bytes) != 2:
-            return None
-        length = struct.unpack('<H', length_bytes)[0]
-
-        # Read payload
-        payload = self.port.read(length)
-        if len(payload) != length:
-            return None
-
-        # Read end delimiter
-        end_byte = self.port.read(1)
-        if not end_byte or end_byte[0] != self.END_DELIMITER:
-            print(f"Warning: Invalid end delimiter (got {end_byte.hex() if end_byte else 'None'})")
-
-        return {'label': label, 'data': payload}
+
+            # Need payload and end delimiter
+            end = 4 + length
+            if len(rxbuf) <= end:
+                return None
+
+            if rxbuf[end] != self.END_DELIMITER:
+                print(f"Warning: Invalid end delimiter (got {rxbuf[end]:02x})")
+                del rxbuf[:1]  # Resync after this start byte
+                continue
+
+            payload = bytes(rxbuf[4:end])
+            del rxbuf[:end + 1]
+            return {'label': label, 'data': payload}
 
     def process_dmx_packet(self, payload):
         """Process a Label 5 (Received DMX) packet"""
@@ -120,10 +125,9 @@ class EnttecDMXProInput:
             start_code = dmx_with_start[0]
             channels = dmx_with_start[1:]
 
-            # Update internal DMX data array
-            for i, value in enumerate(channels):
-                if i < 512:
-                    self.dmx_data[i] = value
+            # Update internal DMX data array (single slice copy)
+            n = min(len(channels), 512)
+            self.dmx_data[:n] = channels[:n]
 
             self.packet_count += 1
             return True
@@ -136,15 +140,40 @@ class EnttecDMXProInput:
         return 0
 
     def get_channels(self, start, end):
-        """Get a range of DMX channel values"""
-        return [self.get_channel(i) for i in range(start, end + 1)]
-
-    def poll(self):
-        """Poll for new DMX data"""
-        message = self.read_message()
-        if message and message['label'] == self.LABEL_RECEIVED_DMX:
-            return self.process_dmx_packet(message['data'])
-        return False
+        """Get a range of DMX channel values (1-512, inclusive) as a bytearray copy"""
+        return self.dmx_data[start - 1:end]
+
+    def poll(self, timeout=0.0):
+        """Poll for new DMX data (reads everything buffered, parses every message)
+
+        Waits up to timeout seconds for data to arrive.
+        Returns the number of DMX packets received.
+        """
+        if self.fd is not None and timeout:
+            try:
+                ready, _, _ = select.select([self.fd], [], [], timeout)
+                if not ready:
+                    return 0  # Waited the full timeout, nothing arrived
+            except (OSError, ValueError):
+                self.fd = None  # Can't wait on this fd - sleep from now on
+        waiting = self.port.in_waiting
+        if not waiting:
+            # Nothing read and no wait happened above - sleep so the
+            # caller's loop can't spin
+            if timeout:
+                time.sleep(timeout)
+            return 0
+        self.rxbuf += self.port.read(waiting)
+
+        packets_received = 0
+        while True:
+            message = self.read_message()
+            if message is None:
+                break
+            if message['label'] == self.LABEL_RECEIVED_DMX:
+                if self.process_dmx_packet(message['data']):
+                    packets_received += 1
+        return packets_received
 
     def close(self):
         """Close the serial port"""
@@ -172,7 +201,9 @@ def main():
         no_data_timeout = time.time()
 
         while True:
-            if dmx_input.poll():
+            # Sleeps until data arrives (up to 20 ms) instead of a fixed-rate poll
+            packets = dmx_input.poll(timeout=0.02)
+            if packets:
                 no_data_timeout = time.time()
 
                 # Print every 100ms to avoid flooding
@@ -182,10 +213,10 @@ def main():
                     channels_1_8 = dmx_input.get_channels(1, 8)
                     channels_9_16 = dmx_input.get_channels(9, 16)
 
-                    print(f"\rPackets: {dmx_input.packet_count:6d} | "
-                          f"Ch 1-8: {' '.join(f'{v:3d}' for v in channels_1_8)} | "
-                          f"Ch 9-16: {' '.join(f'{v:3d}' for v in channels_9_16)}",
-                          end='', flush=True)
+                    sys.stdout.write(f"\rPackets: {dmx_input.packet_count:6d} | "
+                                     f"Ch 1-8: {' '.join(map(_VALUE_TEXT.__getitem__, channels_1_8))} | "
+                                     f"Ch 9-16: {' '.join(map(_VALUE_TEXT.__getitem__, channels_9_16))}")
+                    sys.stdout.flush()
 
                     last_print = now
             else:
@@ -196,8 +227,6 @@ def main():
                           end='', flush=True)
                     no_data_timeout = time.time()
 
-            time.sleep(0.01)  # 100Hz polling
-
     except KeyboardInterrupt:
         print("\n\n" + "-" * 60)
         print(f"Stopped. Total packets received: {dmx_input.packet_count}")